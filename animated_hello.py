@@ -9,22 +9,56 @@ Animated Multi-Language Hello World
 브라우저: http://localhost:5050
 """
 
+import os
+import selectors
 import subprocess
+import hashlib
 import shutil
+import socket
+import tempfile
 import time
 import json
 import threading
-import queue
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import socketserver
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import webbrowser
+import zlib
+
+try:
+    import orjson  # 선택 의존성: 있으면 C 구현으로 이벤트 직렬화
+
+    def json_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def json_bytes(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 PORT = 5050
 WORKSPACE = Path(__file__).parent / "animated_hello_workspace"
+# 소스 해시별 컴파일 결과 캐시 (재실행 시 컴파일 생략)
+BUILD_CACHE = Path.home() / ".cache" / "animated_hello"
+
+# 이벤트 구독자 스트림 (SSE 클라이언트별, 실시간 업데이트용)
+subscribers = set()
+subscribers_lock = threading.Lock()
+
+# 애니메이션은 한 번에 하나만 실행 (탭이 여러 개여도 같은 워크스페이스/스트림을 공유)
+animation_lock = threading.Lock()
+
+# 타이핑 속도 (한 줄당 ms, 브라우저에서 애니메이션)
+TYPING_MS = 350
+
+# SSE 하트비트 간격 (초)
+HEARTBEAT_INTERVAL = 15
 
-# 이벤트 큐 (실시간 업데이트용)
-event_queue = queue.Queue()
+# 'done' 이벤트 뒤에 넣는 스트림 종료 신호
+END_OF_STREAM = None
+
+# 실행마다 내용이 같은 이벤트 → 인코딩된 JSON 캐시
+STATIC_EVENT_TYPES = frozenset({'step', 'status', 'cursor_show', 'cursor_hide', 'code_full', 'progress'})
+encoded_events = {}
 
 # 언어 정의
 LANGUAGES = [
@@ -112,6 +146,17 @@ _start:
     },
 ]
 
+# 소스는 바뀌지 않으므로 UTF-8 인코딩은 임포트 시 한 번만 수행
+for _lang in LANGUAGES:
+    _lang["code_bytes"] = _lang["code"].encode('utf-8')
+
+# 동시 컴파일 수 (코어 수보다 많은 컴파일러를 띄우지 않음)
+COMPILE_WORKERS = min(len(LANGUAGES), os.cpu_count() or 1)
+
+# 툴체인 경로는 시작 시 한 번만 탐색 (실행마다 PATH 검색 생략)
+TOOL_PATHS = {cmd[0]: shutil.which(cmd[0]) for lang in LANGUAGES for cmd in lang["compile_cmds"]}
+MISSING_TOOLS = sorted(tool for tool, path in TOOL_PATHS.items() if path is None)
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -292,6 +337,9 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             font-size: 0.85em;
             color: #58a6ff;
             margin-top: 5px;
+            white-space: pre-wrap;
+            max-height: 80px;
+            overflow: auto;
         }
 
         .footer {
@@ -386,6 +434,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         const languages = LANGUAGES_JSON;
         let eventSource = null;
         let isRunning = false;
+        let typingTimers = [];
 
         // 패널 생성
         function createPanels() {
@@ -408,6 +457,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                         <div class="cmd-area" id="cmdArea-${idx}">
                             <div class="cmd-label">$ 실행 명령어:</div>
                             <div class="cmd-text" id="cmdText-${idx}">-</div>
+                            <div class="compile-log" id="log-${idx}"></div>
                         </div>
                         <div class="output-label">출력 결과:</div>
                         <div class="output-text" id="output-${idx}">-</div>
@@ -446,6 +496,19 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             hljs.highlightElement(el);
         }
 
+        // 서버에서 받은 전체 코드를 한 줄씩 타이핑 (타이밍은 브라우저가 담당)
+        function typeCode(idx, code, intervalMs) {
+            const lines = code.split('\\n');
+            let i = 0;
+            clearInterval(typingTimers[idx]);
+            typingTimers[idx] = setInterval(() => {
+                appendCode(idx, lines[i] + '\\n');
+                i++;
+                setProgress(idx, Math.floor(i / lines.length * 30));
+                if (i === lines.length) clearInterval(typingTimers[idx]);
+            }, intervalMs);
+        }
+
         function showCursor(idx, show) {
             document.getElementById(`cursor-${idx}`).style.display = show ? 'inline-block' : 'none';
         }
@@ -466,6 +529,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             document.getElementById(`progress-${idx}`).style.width = percent + '%';
         }
 
+        function appendLog(idx, line) {
+            const el = document.getElementById(`log-${idx}`);
+            el.textContent += line + '\\n';
+            el.scrollTop = el.scrollHeight;
+        }
+
         function setTiming(idx, text) {
             document.getElementById(`timing-${idx}`).textContent = text;
         }
@@ -493,14 +562,35 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                 document.getElementById('btnReset').disabled = false;
             };
 
-            // 실행 시작 요청
-            fetch('/start');
+            // 실행 시작 요청 (빌드 가능한 언어가 없으면 503)
+            // 서버가 구독을 마친 뒤(스트림 연결 후)에 시작해야 첫 이벤트를 놓치지 않음
+            eventSource.onopen = function() {
+                eventSource.onopen = null;
+                requestStart();
+            };
+        }
+
+        function requestStart() {
+            fetch('/start').then(res => {
+                if (res.ok) return;
+                eventSource.close();
+                isRunning = false;
+                document.getElementById('btnStart').disabled = false;
+                document.getElementById('btnReset').disabled = false;
+                res.text().then(tools => {
+                    document.getElementById('globalStatus').textContent = '❌ 컴파일러 없음: ' + tools;
+                });
+            });
         }
 
         function handleEvent(data) {
-            const { type, lang_idx, payload } = data;
+            const { type, lang_idx, payload = {} } = data;
 
             switch(type) {
+                case 'batch':
+                    payload.events.forEach(handleEvent);
+                    break;
+
                 case 'step':
                     setStep(payload.step);
                     document.getElementById('globalStatus').textContent = payload.message;
@@ -518,18 +608,19 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                     showCursor(lang_idx, false);
                     break;
 
-                case 'code_line':
-                    appendCode(lang_idx, payload.line + '\\n');
-                    break;
-
                 case 'code_full':
-                    setCode(lang_idx, payload.code);
+                    if (payload.typing_ms) typeCode(lang_idx, payload.code, payload.typing_ms);
+                    else setCode(lang_idx, payload.code);
                     break;
 
                 case 'compile_start':
                     setCmd(lang_idx, '$ ' + payload.cmd, 'running');
                     break;
 
+                case 'compile_log':
+                    appendLog(lang_idx, payload.line);
+                    break;
+
                 case 'compile_done':
                     setCmd(lang_idx, '$ ' + payload.cmd + '  ✅ (' + payload.time.toFixed(3) + 's)', 'done');
                     break;
@@ -574,6 +665,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         function resetAll() {
             if (isRunning) return;
             if (eventSource) eventSource.close();
+            typingTimers.forEach(clearInterval);
 
             languages.forEach((_, idx) => {
                 document.getElementById(`codeContent-${idx}`).textContent = '';
@@ -584,6 +676,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                 document.getElementById(`cmdText-${idx}`).className = 'cmd-text';
                 document.getElementById(`progress-${idx}`).style.width = '0%';
                 document.getElementById(`timing-${idx}`).textContent = '';
+                document.getElementById(`log-${idx}`).textContent = '';
                 showCursor(idx, false);
             });
 
@@ -597,7 +690,30 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </html>
 '''
 
+# 템플릿과 LANGUAGES는 바뀌지 않으므로 응답 본문을 임포트 시 한 번만 생성
+LANGUAGES_JSON = json_bytes([{
+    "name": l["name"],
+    "filename": l["filename"],
+    "color": l["color"],
+    "syntax": l["syntax"],
+} for l in LANGUAGES]).decode('utf-8')
+HTML_BYTES = HTML_TEMPLATE.replace('LANGUAGES_JSON', LANGUAGES_JSON).encode('utf-8')
+HTML_LENGTH = str(len(HTML_BYTES))
+
+# sendfile()로 커널이 직접 전송할 수 있도록 본문을 임시 파일에 보관
+HTML_FILE = tempfile.TemporaryFile()
+HTML_FILE.write(HTML_BYTES)
+HTML_FILE.flush()
+
 class AnimatedHandler(SimpleHTTPRequestHandler):
+    # 작은 SSE 프레임이 Nagle 알고리즘에 묶여 지연되지 않도록 TCP_NODELAY 설정
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # 오래 열려 있는 SSE 연결의 끊김을 커널이 감지하도록 함
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
             self._serve_html()
@@ -609,88 +725,402 @@ class AnimatedHandler(SimpleHTTPRequestHandler):
             self.send_error(404)
 
     def _serve_html(self):
-        lang_json = json.dumps([{
-            "name": l["name"],
-            "filename": l["filename"],
-            "color": l["color"],
-            "syntax": l["syntax"],
-        } for l in LANGUAGES], ensure_ascii=False)
-
-        html = HTML_TEMPLATE.replace('LANGUAGES_JSON', lang_json)
-
-        self.send_response(200)
-        self.send_header('Content-Type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html.encode('utf-8'))
+        # 헤더와 본문이 따로 작은 세그먼트로 나가지 않도록 응답 동안 소켓을 cork
+        self._set_cork(True)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', HTML_LENGTH)
+            self.end_headers()
+            if hasattr(os, 'sendfile'):
+                # 오프셋을 직접 넘기므로 여러 스레드가 같은 파일을 공유해도 안전
+                self.connection.sendfile(HTML_FILE, 0, len(HTML_BYTES))
+            else:
+                self.wfile.write(HTML_BYTES)
+        finally:
+            self._set_cork(False)
+
+    def _set_cork(self, enabled):
+        # TCP_CORK는 리눅스 전용
+        if hasattr(socket, 'TCP_CORK'):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(enabled))
 
     def _serve_events(self):
-        self.send_response(200)
-        self.send_header('Content-Type', 'text/event-stream')
-        self.send_header('Cache-Control', 'no-cache')
-        self.send_header('Connection', 'keep-alive')
-        self.end_headers()
-
+        # 헤더를 보내기 전에 구독해야 함: 브라우저는 헤더를 받은 뒤(onopen)에야 /start를
+        # 요청하므로, 그 이후 발행되는 이벤트는 하나도 놓치지 않음
+        stream = subscribe()
         try:
-            while True:
-                try:
-                    event = event_queue.get(timeout=30)
-                    data = json.dumps(event, ensure_ascii=False)
-                    self.wfile.write(f"data: {data}\n\n".encode('utf-8'))
-                    self.wfile.flush()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'keep-alive')
+
+            # 브라우저가 지원하면 스트림 전체를 gzip으로 압축
+            # (버스트마다 Z_SYNC_FLUSH로 내보내서 지연 없이 바로 풀 수 있음)
+            compressor = None
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                self.send_header('Content-Encoding', 'gzip')
+                compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            self.end_headers()
 
-                    if event.get('type') == 'done':
-                        break
-                except queue.Empty:
+            while True:
+                if not stream.ready.wait(timeout=HEARTBEAT_INTERVAL):
                     # 하트비트
-                    self.wfile.write(b": heartbeat\n\n")
-                    self.wfile.flush()
+                    self._write_stream(compressor, b": heartbeat\n\n")
+                    continue
+
+                # 깨어날 때마다 쌓인 프레임을 모아 한 번의 write로 전송
+                # (wfile은 버퍼 없이 소켓에 바로 쓰므로 flush 불필요)
+                stream.ready.clear()
+                burst = []
+                finished = False
+                while stream.frames:
+                    frame = stream.frames.popleft()
+                    if frame is END_OF_STREAM:
+                        finished = True
+                        break
+                    burst.append(frame)
+
+                if burst:
+                    self._write_stream(compressor, b"".join(burst))
+                if finished:
+                    if compressor:
+                        self.wfile.write(compressor.flush())
+                    return
         except:
             pass
+        finally:
+            unsubscribe(stream)
+            # 스트림이 끝나면 keep-alive 연결도 닫음
+            self.close_connection = True
+
+    def _write_stream(self, compressor, data):
+        if compressor:
+            data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.wfile.write(data)
 
     def _start_animation(self):
+        # 모든 언어의 툴체인이 없으면 애니메이션을 시작하지 않음
+        if all(find_missing_tool(lang) for lang in LANGUAGES):
+            body = ', '.join(MISSING_TOOLS).encode('utf-8')
+            self.send_response(503)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        # 이미 실행 중이면 새로 시작하지 않음 (늦게 연 탭은 진행 중인 스트림에 합류)
+        started = animation_lock.acquire(blocking=False)
+
         self.send_response(200)
         self.send_header('Content-Type', 'text/plain')
         self.end_headers()
-        self.wfile.write(b"OK")
+        self.wfile.write(b"OK" if started else b"RUNNING")
 
-        # 애니메이션 스레드 시작
-        thread = threading.Thread(target=run_animation)
-        thread.daemon = True
-        thread.start()
+        if started:
+            # 애니메이션 스레드 시작
+            thread = threading.Thread(target=run_exclusive_animation)
+            thread.daemon = True
+            thread.start()
 
     def log_message(self, format, *args):
         pass
 
-def send_event(event_type, lang_idx=None, payload=None):
-    event_queue.put({
-        "type": event_type,
-        "lang_idx": lang_idx,
-        "payload": payload or {}
-    })
+class EventStream:
+    """SSE 클라이언트 하나의 프레임 버퍼 (deque 추가는 스레드 안전, Event로 깨움)"""
+
+    def __init__(self):
+        self.frames = collections.deque()
+        self.ready = threading.Event()
+
+    def put(self, frame):
+        self.frames.append(frame)
+        self.ready.set()
+
+def subscribe():
+    stream = EventStream()
+    with subscribers_lock:
+        subscribers.add(stream)
+    return stream
+
+def unsubscribe(stream):
+    with subscribers_lock:
+        subscribers.discard(stream)
+
+def encode_event(event_type, lang_idx=None, payload=None):
+    """이벤트를 JSON 바이트로 인코딩 (내용이 고정된 이벤트는 캐시에서 재사용)"""
+    key = None
+    if event_type in STATIC_EVENT_TYPES:
+        key = (event_type, lang_idx, tuple(payload.items()) if payload else ())
+        data = encoded_events.get(key)
+        if data is not None:
+            return data
+
+    # 빈 필드는 생략해 이벤트당 전송 바이트를 줄임
+    event = {"type": event_type}
+    if lang_idx is not None:
+        event["lang_idx"] = lang_idx
+    if payload:
+        event["payload"] = payload
+    data = json_bytes(event)
+
+    if key is not None:
+        encoded_events[key] = data
+    return data
 
-def run_subprocess(cmd, cwd):
+def send_event(event_type, lang_idx=None, payload=None):
+    publish(b"data: " + encode_event(event_type, lang_idx, payload) + b"\n\n")
+    if event_type == 'done':
+        publish(END_OF_STREAM)
+
+def flush_events(pending):
+    """모아 둔 이벤트(인코딩된 JSON)를 하나의 batch 메시지로 전송"""
+    if pending:
+        publish(b'data: {"type":"batch","payload":{"events":['
+                + b','.join(pending) + b']}}\n\n')
+        pending.clear()
+
+def publish(frame):
+    # 한 번 인코딩한 SSE 프레임을 연결된 모든 클라이언트에 전달
+    with subscribers_lock:
+        targets = list(subscribers)
+    for stream in targets:
+        stream.put(frame)
+
+def run_subprocess(cmd, cwd=None, on_line=None, timeout=30):
+    # close_fds=False + 절대 경로 실행 파일 + cwd 없음이면
+    # subprocess가 fork 대신 posix_spawn을 사용함
+    # (파이썬이 연 fd는 기본적으로 상속되지 않으므로 안전)
     start = time.time()
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd, cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True, check=True, timeout=30
+            close_fds=False,
         )
-        return True, time.time() - start, result.stdout.strip(), result.stderr.strip()
-    except subprocess.CalledProcessError as e:
-        return False, time.time() - start, e.stdout or "", e.stderr or str(e)
     except FileNotFoundError:
         return False, time.time() - start, "", f"명령어를 찾을 수 없음: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        return False, time.time() - start, "", "타임아웃"
+
+    # stdout/stderr를 종료까지 기다리지 않고 읽히는 대로 처리
+    output = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    partial = {proc.stdout: b"", proc.stderr: b""}
+    with selectors.DefaultSelector() as selector:
+        for pipe in output:
+            selector.register(pipe, selectors.EVENT_READ)
+
+        while selector.get_map():
+            remaining = start + timeout - time.time()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                proc.stdout.close()
+                proc.stderr.close()
+                return False, time.time() - start, "", "타임아웃"
+
+            for key, _ in selector.select(remaining):
+                pipe = key.fileobj
+                chunk = os.read(pipe.fileno(), 65536)
+                if not chunk:
+                    selector.unregister(pipe)
+                    pipe.close()
+                    if on_line and partial[pipe]:
+                        on_line(partial[pipe].decode('utf-8', 'replace'))
+                    continue
+
+                output[pipe] += chunk
+                if on_line:
+                    *lines, partial[pipe] = (partial[pipe] + chunk).split(b"\n")
+                    for line in lines:
+                        on_line(line.decode('utf-8', 'replace'))
+
+    returncode = proc.wait()
+    stdout = output[proc.stdout].decode('utf-8', 'replace')
+    stderr = output[proc.stderr].decode('utf-8', 'replace')
+    if returncode != 0:
+        return False, time.time() - start, stdout, stderr or str(subprocess.CalledProcessError(returncode, cmd))
+    return True, time.time() - start, stdout.strip(), stderr.strip()
+
+def read_bytes(path):
+    """파일 내용 (없으면 None)"""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+def write_source(path, data):
+    """os.open/os.write로 바로 기록 (텍스트 스트림 계층과 재인코딩 생략)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def build_key(lang):
+    """소스 코드와 컴파일 명령어로 캐시 키 생성"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(lang["code_bytes"])
+    digest.update(repr(lang["compile_cmds"]).encode('utf-8'))
+    return digest.hexdigest()
+
+def restore_build(cached_binary, binary_path, stamp_path, key):
+    """캐시된 바이너리를 워크스페이스로 복사 (캐시에 없거나 실패하면 False → 일반 컴파일)"""
+    try:
+        # 남아 있는 바이너리(읽기 전용일 수 있음)와 스탬프는 덮어쓰지 않고 먼저 삭제
+        # (복사가 중간에 실패해도 불완전한 바이너리가 최신으로 취급되지 않도록)
+        stamp_path.unlink(missing_ok=True)
+        binary_path.unlink(missing_ok=True)
+        shutil.copy2(cached_binary, binary_path)
+        stamp_path.write_text(key)
+        return True
+    except OSError:
+        return False
+
+def store_build(binary_path, cached_binary):
+    """컴파일된 바이너리를 캐시에 저장 (실패해도 무시)"""
+    tmp_path = None
+    try:
+        cached_binary.parent.mkdir(parents=True, exist_ok=True)
+        # 동시에 저장하는 다른 프로세스/스레드와 겹치지 않는 고유한 임시 파일
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{cached_binary.name}.", suffix=".tmp", dir=cached_binary.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copy2(binary_path, tmp_path)
+        tmp_path.replace(cached_binary)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+def sleep_until(deadline):
+    """time.monotonic() 기준 deadline까지 대기 (앞선 작업 시간만큼 덜 잠)"""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    return deadline
+
+def find_missing_tool(lang):
+    """언어의 컴파일 명령어 중 설치되지 않은 도구 이름 (없으면 None)"""
+    for cmd in lang["compile_cmds"]:
+        if TOOL_PATHS[cmd[0]] is None:
+            return cmd[0]
+    return None
+
+def compile_language(idx, lang, timing):
+    """소스 파일 작성 후 컴파일. 성공 여부 반환"""
+    send_event('status', idx, {'text': '컴파일 중...'})
+    send_event('progress', idx, {'percent': 30})
+
+    # 소스 파일 작성
+    source_path = WORKSPACE / lang["filename"]
+    write_start = time.time()
+    if read_bytes(source_path) != lang["code_bytes"]:
+        write_source(source_path, lang["code_bytes"])
+    timing['write'] = time.time() - write_start
+
+    # 워크스페이스의 바이너리가 같은 소스로 빌드됐거나
+    # 캐시된 바이너리가 있으면 컴파일 생략
+    key = build_key(lang)
+    binary_name = lang["run_cmd"][0].replace('./', '')
+    binary_path = WORKSPACE / binary_name
+    stamp_path = WORKSPACE / f"{binary_name}.key"
+    cached_binary = BUILD_CACHE / key / binary_name
+    is_current = read_bytes(stamp_path) == key.encode() and binary_path.exists()
+    if is_current or restore_build(cached_binary, binary_path, stamp_path, key):
+        timing['compile'] = 0.0
+        send_event('compile_done', idx, {'cmd': ' '.join(lang["compile_cmds"][-1]), 'time': 0.0})
+        send_event('status', idx, {'text': '✅ 컴파일 완료 (캐시)'})
+        send_event('progress', idx, {'percent': 70})
+        return True
+
+    # 툴체인이 없으면 프로세스를 띄우지 않고 바로 실패 처리
+    missing_tool = find_missing_tool(lang)
+    if missing_tool:
+        timing['compile'] = 0.0
+        send_event('compile_error', idx, {'cmd': ' '.join(lang["compile_cmds"][0]), 'error': f"명령어를 찾을 수 없음: {missing_tool}"})
+        send_event('status', idx, {'text': '❌ 컴파일 실패'})
+        send_event('progress', idx, {'percent': 100})
+        return False
+
+    # 컴파일
+    compile_total = 0.0
+    failed = False
+
+    last_cmd_str = ""
+    for cmd in lang["compile_cmds"]:
+        cmd_str = ' '.join(cmd)
+        last_cmd_str = cmd_str
+        send_event('compile_start', idx, {'cmd': cmd_str})
+
+        # 미리 찾아 둔 절대 경로로 실행
+        argv = [TOOL_PATHS[cmd[0]]] + cmd[1:]
+        # 컴파일러 출력(경고 등)은 줄 단위로 바로 화면에 전달
+        success, elapsed, stdout, stderr = run_subprocess(
+            argv, WORKSPACE, on_line=lambda line: send_event('compile_log', idx, {'line': line}))
+        compile_total += elapsed
+
+        if not success:
+            send_event('compile_error', idx, {'cmd': cmd_str, 'error': stderr[:100]})
+            send_event('status', idx, {'text': '❌ 컴파일 실패'})
+            failed = True
+            break
+
+    timing['compile'] = compile_total
+
+    if not failed:
+        stamp_path.write_text(key)
+        store_build(binary_path, cached_binary)
+        send_event('compile_done', idx, {'cmd': last_cmd_str, 'time': compile_total})
+        send_event('status', idx, {'text': '✅ 컴파일 완료'})
+        send_event('progress', idx, {'percent': 70})
+    else:
+        send_event('progress', idx, {'percent': 100})
+
+    return not failed
+
+def run_language(idx, lang, timing):
+    """컴파일된 바이너리 실행. 성공 여부 반환"""
+    deadline = time.monotonic() + 0.8  # 실행 단계 최소 표시 시간
+    run_cmd_str = ' '.join(lang["run_cmd"])
+    send_event('status', idx, {'text': '실행 중...'})
+    send_event('run_start', idx, {'cmd': run_cmd_str})
+    send_event('progress', idx, {'percent': 85})
+
+    # 바이너리는 절대 경로로 실행 (cwd 불필요 → posix_spawn 경로)
+    binary_path = WORKSPACE / lang["run_cmd"][0].replace('./', '')
+    success, elapsed, stdout, stderr = run_subprocess([str(binary_path)] + lang["run_cmd"][1:])
+    timing['run'] = elapsed
+
+    if success:
+        send_event('run_done', idx, {'cmd': run_cmd_str, 'output': stdout, 'time': elapsed})
+        send_event('status', idx, {'text': '✅ 실행 완료'})
+    else:
+        send_event('run_error', idx, {'cmd': run_cmd_str, 'error': stderr[:100]})
+        send_event('status', idx, {'text': '❌ 실행 실패'})
+
+    send_event('progress', idx, {'percent': 100})
+
+    # 타이밍 표시
+    total = sum(timing.values())
+    timing_text = f"Write: {timing.get('write', 0):.3f}s | Compile: {timing.get('compile', 0):.3f}s | Run: {timing.get('run', 0):.3f}s | Total: {total:.3f}s"
+    send_event('timing', idx, {'text': timing_text})
+
+    sleep_until(deadline)  # 실행 완료 후 대기 (느리게)
+    return success
+
+def run_exclusive_animation():
+    """animation_lock을 잡은 상태에서 애니메이션 실행 (예외로 끝나도 해제)"""
+    try:
+        run_animation()
+    finally:
+        animation_lock.release()
 
 def run_animation():
     """메인 애니메이션 로직"""
 
-    # 워크스페이스 준비
-    if WORKSPACE.exists():
-        shutil.rmtree(WORKSPACE)
+    # 워크스페이스 준비 (실행 간 유지해서 변경된 파일만 다시 씀)
     WORKSPACE.mkdir(parents=True, exist_ok=True)
 
     timings = [{} for _ in LANGUAGES]
@@ -698,120 +1128,57 @@ def run_animation():
     # ========== STEP 1: 코드 작성 (타이핑 애니메이션) ==========
     send_event('step', payload={'step': 1, 'message': '📝 Step 1: 코드 작성 중...'})
 
+    # 한 틱에 발생한 이벤트는 batch 하나로 묶어서 전송
+    pending = []
+
+    # 코드 전체를 한 번에 보내고 줄 단위 타이핑은 브라우저가 애니메이션
     for idx, lang in enumerate(LANGUAGES):
-        send_event('status', idx, {'text': '작성 중...'})
-        send_event('cursor_show', idx)
-        send_event('progress', idx, {'percent': 0})
-
-    # 한 줄씩 순차적으로 표시
-    code_lines = [lang["code"].split('\n') for lang in LANGUAGES]
-    max_lines = max(len(lines) for lines in code_lines)
-
-    for line_num in range(max_lines):
-        for idx, lines in enumerate(code_lines):
-            if line_num < len(lines):
-                send_event('code_line', idx, {'line': lines[line_num]})
-                progress = int((line_num + 1) / len(lines) * 30)
-                send_event('progress', idx, {'percent': progress})
-        time.sleep(0.35)  # 타이핑 속도 (느리게)
+        pending.append(encode_event('status', idx, {'text': '작성 중...'}))
+        pending.append(encode_event('cursor_show', idx))
+        pending.append(encode_event('progress', idx, {'percent': 0}))
+        pending.append(encode_event('code_full', idx, {'code': lang["code"], 'typing_ms': TYPING_MS}))
+    deadline = time.monotonic()
+    flush_events(pending)
+
+    # 가장 긴 코드의 타이핑이 끝날 때까지 대기
+    max_lines = max(lang["code"].count('\n') + 1 for lang in LANGUAGES)
+    deadline = sleep_until(deadline + max_lines * TYPING_MS / 1000)
 
     for idx in range(len(LANGUAGES)):
-        send_event('cursor_hide', idx)
-        send_event('status', idx, {'text': '✅ 작성 완료'})
+        pending.append(encode_event('cursor_hide', idx))
+        pending.append(encode_event('status', idx, {'text': '✅ 작성 완료'}))
+    flush_events(pending)
 
-    time.sleep(0.5)
+    sleep_until(deadline + 0.5)
 
     # ========== STEP 2: 컴파일 ==========
     send_event('step', payload={'step': 2, 'message': '⚙️ Step 2: 컴파일 중...'})
 
-    for idx, lang in enumerate(LANGUAGES):
-        send_event('status', idx, {'text': '컴파일 중...'})
-        send_event('progress', idx, {'percent': 30})
-
-        # 소스 파일 작성
-        source_path = WORKSPACE / lang["filename"]
-        write_start = time.time()
-        source_path.write_text(lang["code"], encoding="utf-8")
-        timings[idx]['write'] = time.time() - write_start
-
-        # 컴파일
-        compile_total = 0.0
-        failed = False
-
-        last_cmd_str = ""
-        for cmd in lang["compile_cmds"]:
-            cmd_str = ' '.join(cmd)
-            last_cmd_str = cmd_str
-            send_event('compile_start', idx, {'cmd': cmd_str})
-
-            success, elapsed, stdout, stderr = run_subprocess(cmd, WORKSPACE)
-            compile_total += elapsed
-
-            if not success:
-                send_event('compile_error', idx, {'cmd': cmd_str, 'error': stderr[:100]})
-                send_event('status', idx, {'text': '❌ 컴파일 실패'})
-                failed = True
-                break
-
-            time.sleep(1.0)  # 컴파일 진행 시각화 (느리게)
-
-        timings[idx]['compile'] = compile_total
-
-        if not failed:
-            send_event('compile_done', idx, {'cmd': last_cmd_str, 'time': compile_total})
-            send_event('status', idx, {'text': '✅ 컴파일 완료'})
-            send_event('progress', idx, {'percent': 70})
-        else:
-            send_event('progress', idx, {'percent': 100})
-
-        time.sleep(0.2)
+    # 언어별 컴파일을 병렬로 실행 (서브프로세스 대기 중에는 GIL이 풀림)
+    # 컴파일러 자체가 별도 프로세스이므로 스레드 풀로 충분하고,
+    # 작은 VM에서 코어를 초과하지 않도록 CPU 수로 제한
+    with ThreadPoolExecutor(max_workers=COMPILE_WORKERS) as executor:
+        compiled = list(executor.map(
+            compile_language, range(len(LANGUAGES)), LANGUAGES, timings))
 
-    time.sleep(0.5)
+    sleep_until(time.monotonic() + 0.5)
 
     # ========== STEP 3: 실행 ==========
     send_event('step', payload={'step': 3, 'message': '🚀 Step 3: 실행 중...'})
 
-    for idx, lang in enumerate(LANGUAGES):
-        if timings[idx].get('compile', 0) == 0 and not (WORKSPACE / lang["run_cmd"][0].replace('./', '')).exists():
-            # 컴파일 실패한 경우 스킵
-            continue
-
-        run_cmd_str = ' '.join(lang["run_cmd"])
-        send_event('status', idx, {'text': '실행 중...'})
-        send_event('run_start', idx, {'cmd': run_cmd_str})
-        send_event('progress', idx, {'percent': 85})
-
-        success, elapsed, stdout, stderr = run_subprocess(lang["run_cmd"], WORKSPACE)
-        timings[idx]['run'] = elapsed
-
-        if success:
-            send_event('run_done', idx, {'cmd': run_cmd_str, 'output': stdout, 'time': elapsed})
-            send_event('status', idx, {'text': '✅ 실행 완료'})
-        else:
-            send_event('run_error', idx, {'cmd': run_cmd_str, 'error': stderr[:100]})
-            send_event('status', idx, {'text': '❌ 실행 실패'})
-
-        send_event('progress', idx, {'percent': 100})
-
-        # 타이밍 표시
-        total = sum(timings[idx].values())
-        timing_text = f"Write: {timings[idx].get('write', 0):.3f}s | Compile: {timings[idx].get('compile', 0):.3f}s | Run: {timings[idx].get('run', 0):.3f}s | Total: {total:.3f}s"
-        send_event('timing', idx, {'text': timing_text})
-
-        time.sleep(0.8)  # 실행 완료 후 대기 (느리게)
+    # 컴파일에 성공한 언어만 병렬 실행
+    targets = [idx for idx, ok in enumerate(compiled) if ok]
+    with ThreadPoolExecutor(max_workers=len(LANGUAGES)) as executor:
+        results = list(executor.map(
+            lambda idx: run_language(idx, LANGUAGES[idx], timings[idx]), targets))
 
     # ========== STEP 4: 완료 ==========
     send_event('step', payload={'step': 4, 'message': '🏁 Step 4: 완료!'})
+    deadline = time.monotonic() + 0.5
 
-    # 정리
-    try:
-        shutil.rmtree(WORKSPACE)
-    except:
-        pass
-
-    success_count = sum(1 for t in timings if t.get('run', 0) > 0)
+    success_count = sum(results)
 
-    time.sleep(0.5)
+    sleep_until(deadline)
     send_event('done', payload={'message': f'완료! 성공: {success_count}/{len(LANGUAGES)}'})
 
 def main():
@@ -831,7 +1198,9 @@ def main():
 
     threading.Thread(target=open_browser, daemon=True).start()
 
-    with socketserver.TCPServer(("", PORT), AnimatedHandler) as httpd:
+    # 연결마다 스레드를 두어 SSE 스트림이 /start, / 요청을 막지 않도록 함
+    with ThreadingHTTPServer(("", PORT), AnimatedHandler) as httpd:
+        httpd.daemon_threads = True
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -1,22 +1,39 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
-
-from rich.align import Align
-from rich.console import Console, Group
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn, TimeRemainingColumn
-from rich.rule import Rule
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.text import Text
+from typing import IO, TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 플랫폼
+    fcntl = None
+
+# Rich (and pygments behind it) is imported where it is first used so the
+# module itself loads with the standard library only
+if TYPE_CHECKING:
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.progress import Progress, TaskID
+    from rich.syntax import Syntax
+    from rich.table import Table
+    from rich.text import Text
+
+def with_absolute_tool(cmd: Sequence[str]) -> Tuple[str, ...]:
+    """Resolve the tool via PATH once; missing tools keep their name and fail when run."""
+    return (shutil.which(cmd[0]) or cmd[0], *cmd[1:])
 
 @dataclass
 class LanguageSpec:
@@ -26,16 +43,46 @@ class LanguageSpec:
     code_lines: List[str]
     compile_cmds: List[Sequence[str]]
     run_cmd: Sequence[str]
+    source_text: str = field(init=False, repr=False)
+    source_bytes: bytes = field(init=False, repr=False)
+    build_cmd: Optional[Sequence[str]] = field(init=False, repr=False)
+    resolved_run_cmd: Sequence[str] = field(init=False, repr=False)
+    border_style: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.source_text = "\n".join(self.code_lines) + "\n"
+        self.source_bytes = self.source_text.encode("utf-8")
+        self.border_style = LANGUAGE_COLORS.get(self.name, "white")
+        # Chained steps (nasm then ld) run under one shell so Python waits only once
+        compile_cmds = [with_absolute_tool(cmd) for cmd in self.compile_cmds]
+        if not compile_cmds:
+            self.build_cmd = None
+        elif len(compile_cmds) == 1:
+            self.build_cmd = compile_cmds[0]
+        else:
+            self.build_cmd = with_absolute_tool(("sh", "-c", " && ".join(shlex.join(cmd) for cmd in compile_cmds)))
+        self.resolved_run_cmd = tuple(self.run_cmd)
+
+    def resolve_run_cmd(self, workspace: Path) -> None:
+        """Point run_cmd at the absolute binary path so no relative lookup happens per run."""
+        self.resolved_run_cmd = (str(workspace / self.run_cmd[0]), *self.run_cmd[1:])
 
 @dataclass
 class LanguageState:
-    visible_lines: List[str] = field(default_factory=list)
+    visible_text: str = ""
     status: str = "⏳ Waiting"
     stdout: str = ""
     stderr: str = ""
     failed: bool = False
     timings: Dict[str, float] = field(default_factory=dict)
 
+@dataclass
+class DashboardLayout:
+    header: Panel
+    table1: Table
+    table2: Table
+    panel_slots: List[Panel]
+
 LANGUAGE_COLORS = {
     "Python": "bright_green",
     "C": "cyan",
@@ -124,151 +171,318 @@ LANGUAGES: List[LanguageSpec] = [
 
 WORKSPACE = Path.cwd() / "educational_hello_workspace"
 
-terminal_size = shutil.get_terminal_size()
-console = Console(width=int(terminal_size.columns * 1.8))  # Auto-detect terminal width and multiply by 1.8
+UI_REFRESH_INTERVAL = 0.1
+REVEAL_INTERVAL = 0.3
+PIPE_BUFFER_SIZE = 1 << 20
+
+def available_cpus() -> int:
+    # Respect CPU affinity/cgroup pinning (e.g. CI containers) where the platform exposes it
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+WORKER_COUNT = min(len(LANGUAGES), available_cpus())
+
+@functools.lru_cache(maxsize=None)
+def cached_syntax_class() -> type:
+    from rich.syntax import Syntax
+    from rich.text import Text
+
+    class CachedSyntax(Syntax):
+        """Syntax that runs the lexer once and reuses the highlighted text on every refresh."""
+
+        _highlighted: Optional[Text] = None
+
+        def highlight(self, code: str, line_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Text:
+            if self._highlighted is None:
+                self._highlighted = super().highlight(code, line_range)
+            return self._highlighted.copy()
+
+    return CachedSyntax
+
+# Revealed code only ever grows, so (language, revealed length) identifies its highlighting
+_syntax_cache: Dict[Tuple[str, int], Syntax] = {}
+
+@functools.lru_cache(maxsize=512)
+def cached_text(line: str, style: str) -> Text:
+    """Status lines repeat across frames; Rich only reads Text while rendering, so share them."""
+    from rich.text import Text
+
+    return Text(line, style=style)
 
 def format_timing(value: float) -> str:
     return f"{value:.3f}s"
 
-def run_subprocess(cmd: Sequence[str], cwd: Path) -> Tuple[bool, float, str, str]:
-    start = time.time()
+def enlarge_pipe(pipe: Optional[IO]) -> None:
+    """Grow the kernel pipe buffer so verbose compilers rarely block on a full pipe."""
+    if pipe is None or fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    with contextlib.suppress(OSError):
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+
+def run_subprocess(cmd: Sequence[str], cwd: Optional[Path] = None) -> Tuple[bool, float, str, str]:
+    start = time.perf_counter()
     try:
-        result = subprocess.run(
-            tuple(str(part) for part in cmd),
+        # Absolute executable, no cwd change and close_fds=False lets CPython use
+        # posix_spawn (vfork) instead of fork+exec; Python's own fds are
+        # non-inheritable by default, so nothing extra leaks into the child
+        process = subprocess.Popen(
+            cmd,
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            check=True,
+            bufsize=PIPE_BUFFER_SIZE,
+            close_fds=False,
         )
-        elapsed = time.time() - start
-        stdout_text = result.stdout.strip()
-        stderr_text = result.stderr.strip()
-        return True, elapsed, stdout_text, stderr_text
     except FileNotFoundError as exc:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         return False, elapsed, "", str(exc)
-    except subprocess.CalledProcessError as exc:
-        elapsed = time.time() - start
-        stdout_text = (exc.stdout or "").strip()
-        stderr_text = (exc.stderr or "").strip()
-        return False, elapsed, stdout_text, stderr_text
+    with process:
+        enlarge_pipe(process.stdout)
+        enlarge_pipe(process.stderr)
+        stdout_text, stderr_text = process.communicate()
+    elapsed = time.perf_counter() - start
+    # Successful compiles usually print nothing; only strip when there is output
+    stdout_text = stdout_text.strip() if stdout_text else ""
+    stderr_text = stderr_text.strip() if stderr_text else ""
+    return process.returncode == 0, elapsed, stdout_text, stderr_text
 
 def write_source_file(spec: LanguageSpec, workspace: Path) -> Tuple[bool, float, str]:
-    start = time.time()
+    start = time.perf_counter()
     path = workspace / spec.filename
     try:
-        source = "\n".join(spec.code_lines) + "\n"
-        path.write_text(source, encoding="utf-8")
-        elapsed = time.time() - start
+        path.write_bytes(spec.source_bytes)
+        elapsed = time.perf_counter() - start
         return True, elapsed, ""
     except OSError as exc:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         return False, elapsed, str(exc)
 
 def cleanup_workspace(workspace: Path) -> bool:
-    if not workspace.exists():
-        return True
     try:
-        shutil.rmtree(workspace)
+        # A missing workspace is already clean; rmtree reports it without a separate exists() probe
+        with contextlib.suppress(FileNotFoundError):
+            shutil.rmtree(workspace)
         return True
     except OSError:
         return False
 
-def build_language_panel(spec: LanguageSpec, state: LanguageState, step_name: str) -> Panel:
-    code_text = "\n".join(state.visible_lines)
-    if code_text:
-        syntax = Syntax(
-            code_text,
-            spec.syntax,
-            theme="monokai",
-            line_numbers=True,
-            word_wrap=False,  # Disable word wrap for better readability
-        )
+def build_language_body(spec: LanguageSpec, state: LanguageState, step_name: str) -> Group:
+    from rich.align import Align
+    from rich.console import Group
+    from rich.rule import Rule
+
+    if state.visible_text:
+        key = (spec.name, len(state.visible_text))
+        syntax = _syntax_cache.get(key)
+        if syntax is None:
+            syntax = cached_syntax_class()(
+                state.visible_text,
+                spec.syntax,
+                theme="monokai",
+                line_numbers=True,
+                word_wrap=False,  # Disable word wrap for better readability
+            )
+            _syntax_cache[key] = syntax
         code_renderable = syntax
     else:
-        code_renderable = Align.center(Text("… awaiting reveal …", style="dim"), vertical="middle")
+        code_renderable = Align.center(cached_text("… awaiting reveal …", "dim"), vertical="middle")
     status_lines: List[Text] = []
-    status_lines.append(Text(state.status, style="bold"))
+    status_lines.append(cached_text(state.status, "bold"))
     if state.stdout:
-        status_lines.append(Text(f"stdout: {state.stdout}", style="green"))
+        status_lines.append(cached_text(f"stdout: {state.stdout}", "green"))
     if state.stderr:
-        status_lines.append(Text(f"stderr: {state.stderr}", style="red"))
+        status_lines.append(cached_text(f"stderr: {state.stderr}", "red"))
     if step_name == "Step 4":
         timing_parts = []
         for label in ("write", "compile", "run"):
             if label in state.timings:
                 timing_parts.append(f"{label}: {format_timing(state.timings[label])}")
         if timing_parts:
-            status_lines.append(Text(" ⏱  " + " | ".join(timing_parts), style="cyan"))
+            status_lines.append(cached_text(" ⏱  " + " | ".join(timing_parts), "cyan"))
         if "total" in state.timings:
-            status_lines.append(Text(f" total: {format_timing(state.timings['total'])}", style="yellow"))
-    body = Group(
+            status_lines.append(cached_text(f" total: {format_timing(state.timings['total'])}", "yellow"))
+    return Group(
         code_renderable,
         Rule(style="dim"),
         *(Align.left(line) for line in status_lines),
     )
-    panel = Panel(
-        body,
-        title=f"[bold]{spec.name}[/bold]",
-        border_style=LANGUAGE_COLORS.get(spec.name, "white"),
-    )
-    return panel
 
-def render_layout(step_key: str, step_title: str, step_caption: str, states: List[LanguageState], progress: Optional[Progress] = None) -> Group:
-    header = Panel(
-        Text(step_title, justify="center", style="bold white on blue"),
-        subtitle=step_caption,
-        subtitle_align="left",
-    )
+def build_layout() -> DashboardLayout:
+    """Create the header, tables and language panels once; refreshes only swap their contents."""
+    from rich.panel import Panel
+    from rich.table import Table
 
-    # Build all panels
-    panels = [build_language_panel(spec, state, step_key) for spec, state in zip(LANGUAGES, states)]
-
-    renderables = [header]
+    header = Panel("", subtitle_align="left")
+    panel_slots = [
+        Panel(
+            "",
+            title=f"[bold]{spec.name}[/bold]",
+            border_style=spec.border_style,
+        )
+        for spec in LANGUAGES
+    ]
 
     # First table: C and C++ (top row)
     table1 = Table(expand=True, show_header=True, header_style="bold")
     table1.add_column(LANGUAGES[0].name, justify="center", ratio=1)  # C
     table1.add_column(LANGUAGES[1].name, justify="center", ratio=1)  # C++
-    table1.add_row(panels[0], panels[1])
-    renderables.append(table1)
+    table1.add_row(panel_slots[0], panel_slots[1])
 
     # Second table: Rust and Assembly (bottom row)
     table2 = Table(expand=True, show_header=True, header_style="bold")
     table2.add_column(LANGUAGES[2].name, justify="center", ratio=1)  # Rust
     table2.add_column(LANGUAGES[3].name, justify="center", ratio=1)  # Assembly
-    table2.add_row(panels[2], panels[3])
-    renderables.append(table2)
+    table2.add_row(panel_slots[2], panel_slots[3])
+
+    return DashboardLayout(header=header, table1=table1, table2=table2, panel_slots=panel_slots)
+
+def render_layout(layout: DashboardLayout, step_key: str, step_title: str, step_caption: str, states: List[LanguageState], progress: Optional[Progress] = None) -> Group:
+    from rich.console import Group
+    from rich.text import Text
 
+    layout.header.renderable = Text(step_title, justify="center", style="bold white on blue")
+    layout.header.subtitle = step_caption
+
+    # Refill every language panel in place
+    for panel, spec, state in zip(layout.panel_slots, LANGUAGES, states):
+        panel.renderable = build_language_body(spec, state, step_key)
+
+    renderables = [layout.header, layout.table1, layout.table2]
     if progress is not None:
         renderables.append(progress)
     return Group(*renderables)
 
+def compile_language(spec: LanguageSpec, state: LanguageState, progress: Progress, task_id: TaskID, refresh: Callable[[], None]) -> None:
+    total_steps = 1 if spec.build_cmd is None else 2
+    state.status = "🗂️ Writing source file"
+    refresh()
+    ok, elapsed, error_message = write_source_file(spec, WORKSPACE)
+    state.timings["write"] = elapsed
+    progress.advance(task_id)
+    if not ok:
+        state.status = f"❌ Write failed: {error_message}"
+        state.stderr = error_message
+        state.failed = True
+        progress.update(task_id, completed=total_steps)
+        refresh()
+        return
+    if spec.build_cmd is None:
+        state.timings["compile"] = 0.0
+        state.status = "✅ Ready to interpret"
+        refresh()
+        progress.update(task_id, completed=total_steps)
+        return
+    state.status = "⚙️ Compiling"
+    refresh()
+    ok, elapsed, stdout_text, stderr_text = run_subprocess(spec.build_cmd, WORKSPACE)
+    state.timings["compile"] = elapsed
+    if not ok:
+        state.status = "❌ Compilation error"
+        state.stderr = stderr_text or stdout_text
+        state.failed = True
+        progress.update(task_id, completed=total_steps)
+        refresh()
+        return
+    if stdout_text:
+        state.stdout = stdout_text
+    if stderr_text:
+        state.stderr = stderr_text
+    state.status = "✅ Compilation complete"
+    progress.update(task_id, completed=total_steps)
+    refresh()
+
+def execute_language(spec: LanguageSpec, state: LanguageState, refresh: Callable[[], None]) -> None:
+    if state.failed:
+        state.status = "⛔ Skipped due to earlier error"
+        return
+    state.status = "🚀 Executing binary"
+    refresh()
+    # Spawned separately from the build so Step 3 keeps its own output and
+    # timing; the binary is exec'd directly, with no shell in between
+    ok, elapsed, stdout_text, stderr_text = run_subprocess(spec.resolved_run_cmd)
+    state.timings["run"] = elapsed
+    if ok:
+        state.status = "✅ Execution succeeded"
+        state.stdout = stdout_text or "<no output>"
+        state.stderr = stderr_text
+    else:
+        state.status = "❌ Execution error"
+        state.stderr = stderr_text or stdout_text or "Execution failed"
+        state.failed = True
+    refresh()
+
 def main() -> int:
-    total_start = time.time()
+    from rich.console import Console
+    from rich.live import Live
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn, TimeRemainingColumn
+
+    terminal_size = shutil.get_terminal_size()
+    console = Console(width=int(terminal_size.columns * 1.8))  # Auto-detect terminal width and multiply by 1.8
+    total_start = time.perf_counter()
     states = [LanguageState() for _ in LANGUAGES]
     cleanup_workspace(WORKSPACE)
     WORKSPACE.mkdir(parents=True, exist_ok=True)
+    for spec in LANGUAGES:
+        spec.resolve_run_cmd(WORKSPACE)
     step_key = "Step 1"
     step_title = "Step 1 • Code Walkthrough ✍️"
     step_caption = "Revealing each language line-by-line with helpful notes."
+    progress: Optional[Progress] = None
+    layout = build_layout()
     with Live(
-        render_layout(step_key, step_title, step_caption, states),
+        render_layout(layout, step_key, step_title, step_caption, states),
         console=console,
-        refresh_per_second=10,
+        refresh_per_second=4,
     ) as live:
-        max_lines = max(len(spec.code_lines) for spec in LANGUAGES)
+        # Worker threads share the Live display, so renders are serialized
+        render_lock = threading.Lock()
+        last_refresh = 0.0
+
+        def refresh(force: bool = False) -> None:
+            # Rebuild the layout at most once per UI_REFRESH_INTERVAL unless a step
+            # transition or a finished language must be shown right away
+            nonlocal last_refresh
+            with render_lock:
+                now = time.perf_counter()
+                if not force and now - last_refresh < UI_REFRESH_INTERVAL:
+                    return
+                last_refresh = now
+                live.update(render_layout(layout, step_key, step_title, step_caption, states, progress))
+
+        def wait_with_refresh(futures: List[Future]) -> None:
+            # Keep repainting while the pipelines run so throttled worker updates
+            # never stay hidden until the next language finishes
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=UI_REFRESH_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                refresh(force=True)
+
+        line_counts = [len(spec.code_lines) for spec in LANGUAGES]
+        reveal_statuses = [
+            [f"📝 Revealed line {number} / {count}" for number in range(1, count + 1)]
+            for count in line_counts
+        ]
+        max_lines = max(line_counts)
+        # Pace against absolute deadlines so render time is absorbed into each interval
+        deadline = time.perf_counter()
         for line_index in range(max_lines):
-            for spec_index, spec in enumerate(LANGUAGES):
-                if line_index < len(spec.code_lines):
-                    states[spec_index].visible_lines.append(spec.code_lines[line_index])
-                    states[spec_index].status = f"📝 Revealed line {line_index + 1} / {len(spec.code_lines)}"
-            live.update(render_layout(step_key, step_title, step_caption, states))
-            time.sleep(0.3)
+            for spec, state, count, statuses in zip(LANGUAGES, states, line_counts, reveal_statuses):
+                if line_index < count:
+                    line = spec.code_lines[line_index]
+                    state.visible_text = f"{state.visible_text}\n{line}" if line_index else line
+                    state.status = statuses[line_index]
+            refresh(force=True)
+            deadline += REVEAL_INTERVAL
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
         for state in states:
             state.status = "✅ Source ready"
-        live.update(render_layout(step_key, step_title, step_caption, states))
+        refresh(force=True)
         step_key = "Step 2"
         step_title = "Step 2 • Compilation Progress ⚙️"
         step_caption = "Writing files and compiling each language with live progress."
@@ -280,82 +494,32 @@ def main() -> int:
             TimeRemainingColumn(),
         )
         progress.start()
-        task_meta: List[Tuple[int, int]] = []
+        task_ids: List[TaskID] = []
         for spec in LANGUAGES:
-            total_steps = 1 + len(spec.compile_cmds)
-            task_id = progress.add_task(f"📦 {spec.name}", total=total_steps)
-            task_meta.append((task_id, total_steps))
-        live.update(render_layout(step_key, step_title, step_caption, states, progress))
-        for index, spec in enumerate(LANGUAGES):
-            state = states[index]
-            task_id, total_steps = task_meta[index]
-            state.status = "🗂️ Writing source file"
-            live.update(render_layout(step_key, step_title, step_caption, states, progress))
-            ok, elapsed, error_message = write_source_file(spec, WORKSPACE)
-            state.timings["write"] = elapsed
-            progress.advance(task_id)
-            if not ok:
-                state.status = f"❌ Write failed: {error_message}"
-                state.stderr = error_message
-                state.failed = True
-                progress.update(task_id, completed=total_steps)
-                live.update(render_layout(step_key, step_title, step_caption, states, progress))
-                continue
-            if not spec.compile_cmds:
-                state.timings["compile"] = 0.0
-                state.status = "✅ Ready to interpret"
-                live.update(render_layout(step_key, step_title, step_caption, states, progress))
-                progress.update(task_id, completed=total_steps)
-                continue
-            compile_time = 0.0
-            for cmd_index, cmd in enumerate(spec.compile_cmds, start=1):
-                state.status = f"⚙️ Compiling ({cmd_index}/{len(spec.compile_cmds)})"
-                live.update(render_layout(step_key, step_title, step_caption, states, progress))
-                ok, elapsed, stdout_text, stderr_text = run_subprocess(cmd, WORKSPACE)
-                compile_time += elapsed
-                if not ok:
-                    state.status = "❌ Compilation error"
-                    state.stderr = stderr_text or stdout_text
-                    state.failed = True
-                    progress.update(task_id, completed=total_steps)
-                    live.update(render_layout(step_key, step_title, step_caption, states, progress))
-                    break
-                progress.advance(task_id)
-                if stdout_text:
-                    state.stdout = stdout_text
-                if stderr_text:
-                    state.stderr = stderr_text
-            if state.failed:
-                state.timings["compile"] = compile_time
-                continue
-            state.timings["compile"] = compile_time
-            state.status = "✅ Compilation complete"
-            progress.update(task_id, completed=total_steps)
-            live.update(render_layout(step_key, step_title, step_caption, states, progress))
+            total_steps = 1 if spec.build_cmd is None else 2
+            task_ids.append(progress.add_task(f"📦 {spec.name}", total=total_steps))
+        refresh(force=True)
+        # Languages are independent and the compilers run as child processes,
+        # so pipelines run on threads, at most one per usable CPU
+        with ThreadPoolExecutor(max_workers=WORKER_COUNT) as executor:
+            futures = [
+                executor.submit(compile_language, spec, state, progress, task_id, refresh)
+                for spec, state, task_id in zip(LANGUAGES, states, task_ids)
+            ]
+            wait_with_refresh(futures)
         progress.refresh()
         progress.stop()
+        progress = None
         step_key = "Step 3"
         step_title = "Step 3 • Execution 🎬"
         step_caption = "Running each hello-world and capturing the output."
-        live.update(render_layout(step_key, step_title, step_caption, states))
-        for index, spec in enumerate(LANGUAGES):
-            state = states[index]
-            if state.failed:
-                state.status = "⛔ Skipped due to earlier error"
-                continue
-            state.status = "🚀 Executing binary"
-            live.update(render_layout(step_key, step_title, step_caption, states))
-            ok, elapsed, stdout_text, stderr_text = run_subprocess(spec.run_cmd, WORKSPACE)
-            state.timings["run"] = elapsed
-            if ok:
-                state.status = "✅ Execution succeeded"
-                state.stdout = stdout_text or "<no output>"
-                state.stderr = stderr_text
-            else:
-                state.status = "❌ Execution error"
-                state.stderr = stderr_text or stdout_text or "Execution failed"
-                state.failed = True
-            live.update(render_layout(step_key, step_title, step_caption, states))
+        refresh(force=True)
+        with ThreadPoolExecutor(max_workers=WORKER_COUNT) as executor:
+            futures = [
+                executor.submit(execute_language, spec, state, refresh)
+                for spec, state in zip(LANGUAGES, states)
+            ]
+            wait_with_refresh(futures)
         step_key = "Step 4"
         step_title = "Step 4 • Performance Metrics ⏱"
         step_caption = "Reviewing time spent writing, compiling, and running each language."
@@ -365,8 +529,8 @@ def main() -> int:
                 state.timings["total"] = total
             if not state.failed and "compile" not in state.timings:
                 state.timings.setdefault("compile", 0.0)
-        live.update(render_layout(step_key, step_title, step_caption, states))
-    total_elapsed = time.time() - total_start
+        refresh(force=True)
+    total_elapsed = time.perf_counter() - total_start
     cleaned = cleanup_workspace(WORKSPACE)
     console.print()
     console.print(f"🏁 Total elapsed time: {format_timing(total_elapsed)}")
@@ -12,13 +12,24 @@ Features:
 - 다크 테마 UI
 """
 
+import atexit
+import bisect
+import errno
+import functools
+import hashlib
+import os
+import re
+import shlex
 import subprocess
 import shutil
+import tempfile
 import time
 import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Tuple
 import tkinter as tk
 from tkinter import ttk, scrolledtext, font as tkfont
 
@@ -27,6 +38,15 @@ from tkinter import ttk, scrolledtext, font as tkfont
 WINDOW_WIDTH = 1920
 WINDOW_HEIGHT = 1000
 
+# 진행률만 바뀐 패널 갱신의 최대 빈도 (Hz)
+PROGRESS_UPDATE_HZ = 30
+
+# 동시에 띄울 컴파일러 프로세스 수 (이 프로세스가 쓸 수 있는 CPU 수)
+if hasattr(os, "sched_getaffinity"):
+    COMPILE_CONCURRENCY = len(os.sched_getaffinity(0))
+else:
+    COMPILE_CONCURRENCY = os.cpu_count() or 1
+
 # 다크 테마 색상
 COLORS = {
     "bg": "#1e1e1e",
@@ -44,6 +64,9 @@ COLORS = {
     "code_bg": "#1e1e1e",
 }
 
+# 컴파일 결과 캐시 (소스·명령어·툴체인 버전이 같으면 재사용)
+BUILD_CACHE = Path.home() / ".cache" / "hello_asm"
+
 # 신택스 하이라이팅 색상
 SYNTAX_COLORS = {
     "keyword": "#569cd6",
@@ -66,6 +89,38 @@ class LanguageSpec:
     compile_cmds: List[List[str]]
     run_cmd: List[str]
     keywords: List[str]
+    comment_prefix: str = "//"
+    code_bytes: bytes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # 소스는 상수이므로 UTF-8 인코딩은 한 번만
+        self.code_bytes = self.code.encode("utf-8")
+
+    @functools.cached_property
+    def highlight_pattern(self) -> re.Pattern:
+        """모든 토큰 종류를 하나의 정규식으로 (그룹 이름 = 태그 이름, 처음 쓸 때 한 번만 컴파일)"""
+        keywords = "|".join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        return re.compile(
+            rf"(?P<comment>{re.escape(self.comment_prefix)}[^\n]*)"
+            r'|(?P<string>"[^"\n]*")'
+            r"|(?P<preprocessor>#\w+|\bsection\b)"
+            rf"|(?P<keyword>(?<!\w)(?:{keywords})(?!\w))"
+            r"|(?P<number>\b\d+\b)"
+        )
+
+    @functools.cached_property
+    def highlight_ranges(self) -> Dict[str, Tuple[str, ...]]:
+        """태그별 Tk 인덱스 목록 (시작, 끝, 시작, 끝, ...). 소스가 상수이므로 한 번만 계산"""
+        line_starts = [0] + [m.end() for m in re.finditer("\n", self.code)]
+
+        def tk_index(offset: int) -> str:
+            line = bisect.bisect_right(line_starts, offset) - 1
+            return f"{line + 1}.{offset - line_starts[line]}"
+
+        ranges: Dict[str, List[str]] = {}
+        for match in self.highlight_pattern.finditer(self.code):
+            ranges.setdefault(match.lastgroup, []).extend((tk_index(match.start()), tk_index(match.end())))
+        return {tag: tuple(indices) for tag, indices in ranges.items()}
 
 @dataclass
 class LanguageState:
@@ -73,10 +128,11 @@ class LanguageState:
     progress: float = 0.0
     output: str = ""
     error: str = ""
-    write_time: float = 0.0
-    compile_time: float = 0.0
-    run_time: float = 0.0
-    total_time: float = 0.0
+    # 시간은 perf_counter_ns 기준 정수 나노초로 저장하고 표시할 때만 초로 변환
+    write_time_ns: int = 0
+    compile_time_ns: int = 0
+    run_time_ns: int = 0
+    total_time_ns: int = 0
     failed: bool = False
 
 # ==================== 언어 정의 ====================
@@ -165,9 +221,152 @@ _start:
         ],
         run_cmd=["./hello_asm"],
         keywords=["section", "global", "mov", "syscall", "db", "equ", "xor"],
+        comment_prefix=";",
     ),
 ]
 
+# ==================== 툴체인 ====================
+
+@functools.lru_cache(maxsize=None)
+def find_tool(name: str) -> Optional[str]:
+    """PATH에서 도구의 절대 경로 탐색 (도구별로 한 번만)"""
+    return shutil.which(name)
+
+def resolve_toolchain(spec: LanguageSpec) -> List[str]:
+    """찾지 못한 도구 이름 목록 반환 (명령어 자체는 그대로 두어 캐시 키가 바뀌지 않도록)"""
+    missing = [cmd[0] for cmd in spec.compile_cmds if find_tool(cmd[0]) is None]
+    # ./hello_c 처럼 워크스페이스의 바이너리는 PATH 탐색 대상이 아님
+    if "/" not in spec.run_cmd[0] and find_tool(spec.run_cmd[0]) is None:
+        missing.append(spec.run_cmd[0])
+    return missing
+
+def tool_executable(cmd: List[str]) -> Optional[str]:
+    """실행할 파일의 절대 경로 (argv[0]은 그대로 두고 exec 시 PATH 탐색만 생략)"""
+    return None if "/" in cmd[0] else find_tool(cmd[0])
+
+# ==================== 워크스페이스 ====================
+
+def fast_workspace_root() -> Path:
+    """실행 가능한 tmpfs(XDG_RUNTIME_DIR, /dev/shm)를 우선 사용, 없으면 시스템 임시 디렉터리"""
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if not candidate:
+            continue
+        try:
+            flags = os.statvfs(candidate).f_flag
+        except OSError:
+            continue
+        # noexec/읽기 전용 마운트에서는 컴파일한 바이너리를 만들거나 실행할 수 없음
+        if flags & (getattr(os, "ST_NOEXEC", 0) | os.ST_RDONLY):
+            continue
+        if os.access(candidate, os.W_OK | os.X_OK):
+            return Path(candidate)
+    return Path(tempfile.gettempdir())
+
+# 워크스페이스 위치는 모듈 로드 시 한 번만 결정 (이후 chdir 등의 영향 없음)
+WORKSPACE_ROOT = fast_workspace_root()
+
+def discard_directory(path: Path) -> bool:
+    """디렉터리를 즉시 다른 이름으로 옮기고 실제 삭제는 백그라운드 스레드에서 (실패 시 False)"""
+    trash = path.with_name(f"{path.name}.trash.{time.time_ns()}")
+    try:
+        os.rename(path, trash)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    # 데몬 스레드가 아니므로 종료 직전에 시작된 삭제도 끝까지 수행됨
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
+    return True
+
+# ==================== 소스 파일 ====================
+
+def write_source(path: Path, data: bytes):
+    """미리 인코딩한 소스를 os.open/os.write로 기록 (텍스트 래퍼 생략)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# ==================== 프로세스 출력 ====================
+
+# 패널에 보여줄 출력은 앞부분만 디코딩
+OUTPUT_DECODE_LIMIT = 4096
+
+def decode_output(data: Optional[bytes]) -> str:
+    """바이트 출력의 앞부분만 UTF-8로 디코딩 (비어 있으면 디코딩 생략)"""
+    if not data:
+        return ""
+    return data[:OUTPUT_DECODE_LIMIT].decode("utf-8", "replace").strip()
+
+def build_command(spec: LanguageSpec) -> List[str]:
+    """컴파일 명령어 (nasm + ld처럼 여러 단계면 셸 하나로 묶어 프로세스 생성을 한 번으로)"""
+    if len(spec.compile_cmds) == 1:
+        return spec.compile_cmds[0]
+    script = " && ".join(shlex.join(cmd) for cmd in spec.compile_cmds)
+    return [find_tool("sh") or "/bin/sh", "-c", script]
+
+# ==================== 빌드 캐시 ====================
+
+@functools.lru_cache(maxsize=None)
+def toolchain_version(tool: str) -> bytes:
+    """툴체인 버전 출력 (프로세스당 한 번만 조회, 없으면 빈 값)"""
+    try:
+        result = subprocess.run(
+            [tool, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+        return result.stdout
+    except (OSError, subprocess.SubprocessError):
+        return b""
+
+def build_key(spec: LanguageSpec) -> str:
+    """소스 코드, 컴파일 명령어, 툴체인 버전으로 캐시 키 생성"""
+    digest = hashlib.sha256()
+    digest.update(spec.code_bytes)
+    digest.update(b"\0")
+    digest.update(repr(spec.compile_cmds).encode("utf-8"))
+    for cmd in spec.compile_cmds:
+        digest.update(b"\0")
+        digest.update(toolchain_version(cmd[0]))
+    return digest.hexdigest()
+
+def restore_build(cached_binary: Path, binary_path: Path) -> bool:
+    """캐시된 바이너리를 워크스페이스에 하드 링크 (다른 파일시스템이면 복사, 캐시에 없으면 False)"""
+    try:
+        # 워크스페이스에 남은 이전 바이너리가 있으면 링크가 EEXIST로 실패하므로 먼저 삭제
+        binary_path.unlink(missing_ok=True)
+        try:
+            os.link(cached_binary, binary_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copy2(cached_binary, binary_path)
+        return True
+    except OSError:
+        return False
+
+def store_build(binary_path: Path, cached_binary: Path):
+    """컴파일된 바이너리를 캐시에 저장 (실패해도 무시)"""
+    tmp_path = None
+    try:
+        cached_binary.parent.mkdir(parents=True, exist_ok=True)
+        # 동시에 저장하는 다른 프로세스/스레드와 겹치지 않고, 중단돼도 이후 저장을 막지 않는 고유한 임시 파일
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{cached_binary.name}.", suffix=".tmp", dir=cached_binary.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copy2(binary_path, tmp_path)
+        # 읽기 전용으로 두어 하드 링크된 워크스페이스 쪽 쓰기가 캐시를 덮어쓰지 못하게 함
+        os.chmod(tmp_path, 0o555)
+        tmp_path.replace(cached_binary)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
 # ==================== 메인 애플리케이션 ====================
 
 class GraphicalHelloApp:
@@ -192,22 +391,52 @@ class GraphicalHelloApp:
         self.root.resizable(True, True)
 
         # 워크스페이스 설정
-        self.workspace = Path.cwd() / "graphical_hello_workspace"
+        # 중간 산출물은 디스크 대신 메모리(tmpfs)에 두고, 비정상 종료 시에도 정리
+        self.workspace = WORKSPACE_ROOT / f"graphical_hello_workspace_{os.getpid()}"
+        atexit.register(shutil.rmtree, self.workspace, ignore_errors=True)
 
         # 상태 관리
         self.states: List[LanguageState] = [LanguageState() for _ in LANGUAGES]
         self.panels: List[Dict] = []
         self.running = False
 
+        # 언어별 작업 스레드 풀 (클릭마다 스레드를 새로 만들지 않고 재사용)
+        self.pool = ThreadPoolExecutor(max_workers=len(LANGUAGES), thread_name_prefix="lang")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # 작업 스레드의 패널 갱신 요청을 모아 after_idle 한 번에 반영
+        self._dirty = [False] * len(LANGUAGES)
+        self._dirty_lock = threading.Lock()
+        self._last_progress_update = [0.0] * len(LANGUAGES)
+
+        # 코어 수보다 많은 컴파일러가 동시에 돌지 않도록 제한
+        self._compile_slots = threading.BoundedSemaphore(COMPILE_CONCURRENCY)
+
+        # 툴체인 경로를 시작 시 한 번만 확인 (없는 도구는 실행 전에 패널에 표시)
+        self.missing_tools = [resolve_toolchain(spec) for spec in LANGUAGES]
+
+        # UI를 그리는 동안 툴체인을 한 번씩 띄워 공유 라이브러리를 페이지 캐시에 올려 둠
+        threading.Thread(target=self._prewarm_toolchains, daemon=True).start()
+
         # 폰트 설정
         self.code_font = tkfont.Font(family="Consolas", size=11)
         self.title_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
         self.status_font = tkfont.Font(family="Segoe UI", size=10)
 
+        # 언어별 진행 표시줄 스타일은 시작 시 한 번만 등록
+        style = ttk.Style()
+        for spec in LANGUAGES:
+            style.configure(
+                f"{spec.name}.Horizontal.TProgressbar",
+                troughcolor=COLORS["progress_bg"],
+                background=spec.color,
+            )
+
         # UI 구성
         self._create_header()
         self._create_main_content()
         self._create_footer()
+        self._mark_missing_toolchains()
 
     def _create_header(self):
         """헤더 영역 생성"""
@@ -260,10 +489,16 @@ class GraphicalHelloApp:
         )
         title_label.pack(side=tk.LEFT, pady=8)
 
+        # 라벨/진행 표시줄은 변수에 묶어 두고 값만 바꿈 (위젯 재구성 생략)
+        status_var = tk.StringVar(value="⏳ 대기 중")
+        progress_var = tk.DoubleVar(value=0)
+        output_var = tk.StringVar(value="출력: -")
+        timing_var = tk.StringVar(value="⏱ Write: - | Compile: - | Run: - | Total: -")
+
         # 상태 라벨
         status_label = tk.Label(
             title_bar,
-            text="⏳ 대기 중",
+            textvariable=status_var,
             font=self.status_font,
             fg="white",
             bg=spec.color,
@@ -296,19 +531,13 @@ class GraphicalHelloApp:
         progress_frame.pack(fill=tk.X, padx=5, pady=2)
         progress_frame.pack_propagate(False)
 
-        style = ttk.Style()
-        style.configure(
-            f"{spec.name}.Horizontal.TProgressbar",
-            troughcolor=COLORS["progress_bg"],
-            background=spec.color,
-        )
-
         progress_bar = ttk.Progressbar(
             progress_frame,
             style=f"{spec.name}.Horizontal.TProgressbar",
             orient=tk.HORIZONTAL,
             mode="determinate",
             maximum=100,
+            variable=progress_var,
         )
         progress_bar.pack(fill=tk.X, expand=True)
 
@@ -319,7 +548,7 @@ class GraphicalHelloApp:
 
         output_label = tk.Label(
             result_frame,
-            text="출력: -",
+            textvariable=output_var,
             font=self.status_font,
             fg=COLORS["text"],
             bg=COLORS["panel_bg"],
@@ -329,7 +558,7 @@ class GraphicalHelloApp:
 
         timing_label = tk.Label(
             result_frame,
-            text="⏱ Write: - | Compile: - | Run: - | Total: -",
+            textvariable=timing_var,
             font=self.status_font,
             fg=COLORS["warning"],
             bg=COLORS["panel_bg"],
@@ -345,6 +574,10 @@ class GraphicalHelloApp:
             "progress_bar": progress_bar,
             "output_label": output_label,
             "timing_label": timing_label,
+            "status_var": status_var,
+            "progress_var": progress_var,
+            "output_var": output_var,
+            "timing_var": timing_var,
         })
 
         return panel
@@ -360,51 +593,9 @@ class GraphicalHelloApp:
         text_widget.tag_configure("preprocessor", foreground=SYNTAX_COLORS["preprocessor"])
         text_widget.tag_configure("number", foreground=SYNTAX_COLORS["number"])
 
-        content = text_widget.get("1.0", tk.END)
-
-        # 키워드 하이라이팅
-        for keyword in spec.keywords:
-            start = "1.0"
-            while True:
-                pos = text_widget.search(keyword, start, tk.END, regexp=False)
-                if not pos:
-                    break
-                end = f"{pos}+{len(keyword)}c"
-                text_widget.tag_add("keyword", pos, end)
-                start = end
-
-        # 문자열 하이라이팅 ("...")
-        start = "1.0"
-        while True:
-            pos = text_widget.search('"', start, tk.END)
-            if not pos:
-                break
-            end_pos = text_widget.search('"', f"{pos}+1c", tk.END)
-            if end_pos:
-                text_widget.tag_add("string", pos, f"{end_pos}+1c")
-                start = f"{end_pos}+1c"
-            else:
-                break
-
-        # 주석 하이라이팅 (// 또는 ;)
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for comment_char in ['//', ';']:
-                if comment_char in line:
-                    col = line.index(comment_char)
-                    text_widget.tag_add("comment", f"{line_num}.{col}", f"{line_num}.end")
-                    break
-
-        # #include, section 등 전처리기
-        for prep in ["#include", "section"]:
-            start = "1.0"
-            while True:
-                pos = text_widget.search(prep, start, tk.END)
-                if not pos:
-                    break
-                end = f"{pos}+{len(prep)}c"
-                text_widget.tag_add("preprocessor", pos, end)
-                start = end
+        # 미리 계산한 범위를 태그마다 tag_add 한 번으로 적용 (주석/문자열 안의 키워드는 제외)
+        for tag, indices in spec.highlight_ranges.items():
+            text_widget.tag_add(tag, *indices)
 
         text_widget.config(state=tk.DISABLED)
 
@@ -469,44 +660,87 @@ class GraphicalHelloApp:
             panel["status_label"].config(fg=COLORS["success"])
         else:
             status_text = f"⏳ {status_text}"
-        panel["status_label"].config(text=status_text)
+        panel["status_var"].set(status_text)
 
         # 진행 표시줄 업데이트
-        panel["progress_bar"]["value"] = state.progress
+        panel["progress_var"].set(state.progress)
 
         # 출력 라벨 업데이트
         if state.output:
-            panel["output_label"].config(text=f"출력: {state.output}", fg=COLORS["success"])
+            panel["output_var"].set(f"출력: {state.output}")
+            panel["output_label"].config(fg=COLORS["success"])
         elif state.error:
-            panel["output_label"].config(text=f"에러: {state.error[:50]}...", fg=COLORS["error"])
+            panel["output_var"].set(f"에러: {state.error[:50]}...")
+            panel["output_label"].config(fg=COLORS["error"])
 
         # 타이밍 라벨 업데이트
-        timing_text = f"⏱ Write: {state.write_time:.3f}s | Compile: {state.compile_time:.3f}s | Run: {state.run_time:.3f}s | Total: {state.total_time:.3f}s"
-        panel["timing_label"].config(text=timing_text)
-
-    def _run_subprocess(self, cmd: List[str], cwd: Path) -> tuple:
-        """서브프로세스 실행"""
-        start = time.time()
+        timing_text = (
+            f"⏱ Write: {state.write_time_ns / 1e9:.3f}s | Compile: {state.compile_time_ns / 1e9:.3f}s"
+            f" | Run: {state.run_time_ns / 1e9:.3f}s | Total: {state.total_time_ns / 1e9:.3f}s"
+        )
+        panel["timing_var"].set(timing_text)
+
+    def _prewarm_toolchains(self):
+        """각 도구의 --version 실행 (첫 컴파일 지연 감소, 결과는 빌드 캐시 키에 재사용)"""
+        for spec, missing in zip(LANGUAGES, self.missing_tools):
+            if missing:
+                continue
+            for cmd in spec.compile_cmds:
+                toolchain_version(cmd[0])
+
+    def _mark_dirty(self, index: int, progress_only: bool = False):
+        """패널 갱신 요청 (이미 대기 중인 갱신이 있으면 합침)"""
+        now = time.monotonic()
+        with self._dirty_lock:
+            # 진행률만 바뀐 갱신은 초당 PROGRESS_UPDATE_HZ회로 제한
+            if progress_only and now - self._last_progress_update[index] < 1 / PROGRESS_UPDATE_HZ:
+                return
+            self._last_progress_update[index] = now
+            if self._dirty[index]:
+                return
+            self._dirty[index] = True
+        self.root.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        """대기 중인 패널 갱신을 한 번에 반영 (GUI 스레드)"""
+        with self._dirty_lock:
+            indices = [i for i, dirty in enumerate(self._dirty) if dirty]
+            for i in indices:
+                self._dirty[i] = False
+        for i in indices:
+            self._update_panel(i, self.states[i])
+        # 모든 패널 변경을 마친 뒤 다시 그리기를 한 번에 처리
+        if indices:
+            self.root.update_idletasks()
+
+    def _run_subprocess(self, cmd: List[str], cwd: Optional[Path]) -> tuple:
+        """서브프로세스 실행 (경과 시간은 나노초)"""
+        start = time.perf_counter_ns()
         try:
+            # close_fds=False: 파이썬이 연 fd는 기본적으로 상속되지 않으므로
+            # /proc/self/fd 순회를 생략하고 vfork/posix_spawn 경로를 사용.
+            # POSIX에서 run()은 두 파이프를 호출한 스레드에서 selector 하나로 읽으므로
+            # 별도 리더 스레드가 없고, 출력은 bytes로 받아 필요할 때만 디코딩
             result = subprocess.run(
                 cmd,
+                executable=tool_executable(cmd),
                 cwd=cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True,
                 timeout=30,
+                close_fds=False,
             )
-            elapsed = time.time() - start
-            return True, elapsed, result.stdout.strip(), result.stderr.strip()
+            elapsed = time.perf_counter_ns() - start
+            return True, elapsed, decode_output(result.stdout), decode_output(result.stderr)
         except subprocess.CalledProcessError as e:
-            elapsed = time.time() - start
-            return False, elapsed, e.stdout or "", e.stderr or str(e)
+            elapsed = time.perf_counter_ns() - start
+            return False, elapsed, decode_output(e.stdout), decode_output(e.stderr) or str(e)
         except FileNotFoundError as e:
-            elapsed = time.time() - start
+            elapsed = time.perf_counter_ns() - start
             return False, elapsed, "", str(e)
         except subprocess.TimeoutExpired:
-            elapsed = time.time() - start
+            elapsed = time.perf_counter_ns() - start
             return False, elapsed, "", "타임아웃 (30초 초과)"
 
     def _execute_language(self, index: int):
@@ -514,62 +748,73 @@ class GraphicalHelloApp:
         spec = LANGUAGES[index]
         state = self.states[index]
 
+        # 툴체인이 없으면 파일 작성/컴파일 없이 바로 실패 처리
+        if self.missing_tools[index]:
+            self._mark_missing_toolchain(index, state)
+            self._mark_dirty(index)
+            return
+
         # 1. 소스 파일 작성
         state.status = "소스 파일 작성 중..."
         state.progress = 10
-        self.root.after(0, lambda: self._update_panel(index, state))
+        self._mark_dirty(index)
 
-        start = time.time()
+        start = time.perf_counter_ns()
         source_path = self.workspace / spec.filename
         try:
-            source_path.write_text(spec.code, encoding="utf-8")
-            state.write_time = time.time() - start
+            write_source(source_path, spec.code_bytes)
+            state.write_time_ns = time.perf_counter_ns() - start
         except OSError as e:
             state.status = "파일 작성 실패"
             state.error = str(e)
             state.failed = True
-            self.root.after(0, lambda: self._update_panel(index, state))
+            self._mark_dirty(index)
             return
 
         state.progress = 25
-        self.root.after(0, lambda: self._update_panel(index, state))
+        self._mark_dirty(index, progress_only=True)
 
-        # 2. 컴파일
+        # 2. 컴파일 (같은 빌드가 캐시에 있으면 생략)
         if spec.compile_cmds:
-            state.status = "컴파일 중..."
-            state.progress = 40
-            self.root.after(0, lambda: self._update_panel(index, state))
+            binary_name = Path(spec.run_cmd[0]).name
+            binary_path = self.workspace / binary_name
+            cached_binary = BUILD_CACHE / build_key(spec) / binary_name
 
-            compile_total = 0.0
-            for i, cmd in enumerate(spec.compile_cmds):
-                success, elapsed, stdout, stderr = self._run_subprocess(cmd, self.workspace)
-                compile_total += elapsed
+            if restore_build(cached_binary, binary_path):
+                state.status = "컴파일 완료 (캐시)"
+                state.compile_time_ns = 0
+            else:
+                state.status = "컴파일 중..."
+                state.progress = 40
+                self._mark_dirty(index)
+
+                with self._compile_slots:
+                    success, elapsed, stdout, stderr = self._run_subprocess(build_command(spec), self.workspace)
+                state.compile_time_ns = elapsed
 
                 if not success:
                     state.status = "컴파일 실패"
                     state.error = stderr or stdout
                     state.failed = True
-                    state.compile_time = compile_total
-                    state.total_time = state.write_time + state.compile_time
-                    self.root.after(0, lambda: self._update_panel(index, state))
+                    state.total_time_ns = state.write_time_ns + state.compile_time_ns
+                    self._mark_dirty(index)
                     return
 
-                state.progress = 40 + (30 * (i + 1) / len(spec.compile_cmds))
-                self.root.after(0, lambda: self._update_panel(index, state))
-
-            state.compile_time = compile_total
+                store_build(binary_path, cached_binary)
 
         state.progress = 70
-        self.root.after(0, lambda: self._update_panel(index, state))
+        self._mark_dirty(index, progress_only=True)
 
         # 3. 실행
         state.status = "실행 중..."
         state.progress = 85
-        self.root.after(0, lambda: self._update_panel(index, state))
+        self._mark_dirty(index)
 
-        success, elapsed, stdout, stderr = self._run_subprocess(spec.run_cmd, self.workspace)
-        state.run_time = elapsed
-        state.total_time = state.write_time + state.compile_time + state.run_time
+        # 바이너리를 절대 경로로, cwd 변경 없이 실행 (posix_spawn 조건 충족)
+        run_cmd = [str(self.workspace / spec.run_cmd[0]), *spec.run_cmd[1:]]
+        success, elapsed, stdout, stderr = self._run_subprocess(run_cmd, None)
+        state.run_time_ns = elapsed
+        state.total_time_ns = state.write_time_ns + state.compile_time_ns + state.run_time_ns
 
         if success:
             state.status = "실행 완료"
@@ -581,7 +826,7 @@ class GraphicalHelloApp:
             state.failed = True
             state.progress = 100
 
-        self.root.after(0, lambda: self._update_panel(index, state))
+        self._mark_dirty(index)
 
     def _start_execution(self):
         """모든 언어 실행 시작"""
@@ -592,35 +837,39 @@ class GraphicalHelloApp:
         self.run_btn.config(state=tk.DISABLED)
         self.global_status.config(text="🚀 실행 중...")
 
-        # 워크스페이스 초기화
-        if self.workspace.exists():
-            shutil.rmtree(self.workspace)
+        # 워크스페이스 초기화 (이전 내용은 이름만 바꾸고 백그라운드에서 삭제)
+        discard_directory(self.workspace)
         self.workspace.mkdir(parents=True, exist_ok=True)
 
         # 상태 초기화
         self.states = [LanguageState() for _ in LANGUAGES]
 
         def run_all():
-            total_start = time.time()
-            threads = []
-
-            # 병렬 실행
-            for i in range(len(LANGUAGES)):
-                t = threading.Thread(target=self._execute_language, args=(i,))
-                threads.append(t)
-                t.start()
-
-            # 모든 스레드 완료 대기
-            for t in threads:
-                t.join()
-
-            total_elapsed = time.time() - total_start
+            total_start = time.perf_counter_ns()
+
+            # 병렬 실행 후 모든 작업 완료 대기
+            futures = [self.pool.submit(self._execute_language, i) for i in range(len(LANGUAGES))]
+            wait(futures)
+
+            # 예상하지 못한 예외로 끝난 언어는 로그를 남기고 실패로 표시 (패널이 진행 중에 멈추지 않도록)
+            for index, future in enumerate(futures):
+                error = future.exception()
+                if error is None:
+                    continue
+                traceback.print_exception(type(error), error, error.__traceback__)
+                state = self.states[index]
+                state.status = "실행 오류"
+                state.error = str(error) or type(error).__name__
+                state.failed = True
+                state.progress = 100
+                self._mark_dirty(index)
+
+            total_elapsed = (time.perf_counter_ns() - total_start) / 1e9
 
             # 정리
-            try:
-                shutil.rmtree(self.workspace)
+            if discard_directory(self.workspace):
                 cleanup_status = "✅ 정리 완료"
-            except:
+            else:
                 cleanup_status = "⚠️ 정리 실패"
 
             # UI 업데이트
@@ -641,6 +890,24 @@ class GraphicalHelloApp:
         status_text = f"🏁 완료! 성공: {success_count}, 실패: {fail_count} | 총 시간: {total_time:.2f}초 | {cleanup_status}"
         self.global_status.config(text=status_text)
 
+    def _on_close(self):
+        """창 닫기: 작업 스레드 풀 정리 후 종료"""
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _mark_missing_toolchain(self, index: int, state: LanguageState):
+        """툴체인 없음 상태로 표시"""
+        state.status = f"툴체인 없음: {', '.join(self.missing_tools[index])}"
+        state.failed = True
+        state.progress = 100
+
+    def _mark_missing_toolchains(self):
+        """툴체인이 없는 언어의 패널을 미리 비활성 표시"""
+        for index, state in enumerate(self.states):
+            if self.missing_tools[index]:
+                self._mark_missing_toolchain(index, state)
+                self._update_panel(index, state)
+
     def _reset(self):
         """리셋"""
         if self.running:
@@ -650,11 +917,14 @@ class GraphicalHelloApp:
 
         for i, panel in enumerate(self.panels):
             spec = LANGUAGES[i]
-            panel["status_label"].config(text="⏳ 대기 중", fg="white")
-            panel["progress_bar"]["value"] = 0
-            panel["output_label"].config(text="출력: -", fg=COLORS["text"])
-            panel["timing_label"].config(text="⏱ Write: - | Compile: - | Run: - | Total: -")
-
+            panel["status_var"].set("⏳ 대기 중")
+            panel["status_label"].config(fg="white")
+            panel["progress_var"].set(0)
+            panel["output_var"].set("출력: -")
+            panel["output_label"].config(fg=COLORS["text"])
+            panel["timing_var"].set("⏱ Write: - | Compile: - | Run: - | Total: -")
+
+        self._mark_missing_toolchains()
         self.global_status.config(text="준비됨 - '실행' 버튼을 클릭하세요")
 
 # ==================== 메인 ====================
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 
+import atexit
+import errno
+import functools
+import hashlib
+import os
 import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
 import time
 from pathlib import Path
@@ -30,6 +36,8 @@ ASM_SOURCE = textwrap.dedent(
     """
 )
 
+BUILD_CACHE = Path.home() / ".cache" / "hello_asm"
+
 LANGUAGES = [
     {
         "name": "Python",
@@ -72,6 +80,10 @@ LANGUAGES = [
 ]
 
 
+for _lang in LANGUAGES:
+    _lang["source_bytes"] = _lang["source"].encode("utf-8")
+
+
 def format_cmd(cmd):
     if isinstance(cmd, (list, tuple)):
         parts = [str(part) for part in cmd]
@@ -87,23 +99,26 @@ def print_stream(label, data):
         print(f"    {label}: <empty>")
         return
     print(f"    {label}:")
-    for line in data.rstrip().splitlines():
+    # Outputs arrive as bytes and are decoded only when there is something to print
+    for line in data.decode("utf-8", "replace").rstrip().splitlines():
         print(f"      {line}")
 
 
 def run_command(label, cmd, cwd, show_output=False):
     cmd_list = [str(part) for part in cmd]
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         result = subprocess.run(
             cmd_list,
+            # Exec the resolved absolute path (no PATH search) while argv[0] stays as written
+            executable=None if "/" in cmd_list[0] else find_tool(cmd_list[0]),
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             check=True,
+            close_fds=False,
         )
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         print(f"  [{label}] {format_cmd(cmd_list)} ({elapsed:.4f}s)")
         if show_output or result.stdout:
             print_stream("stdout", result.stdout)
@@ -111,12 +126,12 @@ def run_command(label, cmd, cwd, show_output=False):
             print_stream("stderr", result.stderr)
         return True, elapsed
     except FileNotFoundError as exc:
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         print(f"  [{label} FAILED] {format_cmd(cmd_list)} ({elapsed:.4f}s)")
         print(f"    error: {exc}")
         return False, elapsed
     except subprocess.CalledProcessError as exc:
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         print(f"  [{label} FAILED] {format_cmd(cmd_list)} ({elapsed:.4f}s)")
         if exc.stdout:
             print_stream("stdout", exc.stdout)
@@ -125,16 +140,26 @@ def run_command(label, cmd, cwd, show_output=False):
         return False, elapsed
 
 
+def write_bytes(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def write_source_file(lang, workspace):
     path = workspace / lang["filename"]
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
-        path.write_text(lang["source"], encoding="utf-8")
-        elapsed = time.time() - start
+        write_bytes(path, lang["source_bytes"])
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         print(f"  [create] {lang['filename']} ({elapsed:.4f}s)")
         return True
     except OSError as exc:
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         print(f"  [create FAILED] {lang['filename']} ({elapsed:.4f}s)")
         print(f"    error: {exc}")
         return False
@@ -150,8 +175,107 @@ def run_compile_steps(lang, workspace):
     return success
 
 
+@functools.lru_cache(maxsize=None)
+def find_tool(name):
+    return shutil.which(name)
+
+
+def resolve_toolchain(lang):
+    # Return the tools not on PATH; commands stay as written so the printed
+    # lines and the build-cache key are unaffected
+    cmds = list(lang["compile_cmds"])
+    if "/" not in lang["run_cmd"][0]:
+        cmds.append(lang["run_cmd"])
+    return [cmd[0] for cmd in cmds if find_tool(cmd[0]) is None]
+
+
+@functools.lru_cache(maxsize=None)
+def toolchain_version(tool):
+    try:
+        result = subprocess.run(
+            [tool, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+        return result.stdout
+    except (OSError, subprocess.SubprocessError):
+        return b""
+
+
+def build_key(lang):
+    digest = hashlib.sha256()
+    digest.update(lang["source_bytes"])
+    digest.update(b"\0")
+    digest.update(repr(lang["compile_cmds"]).encode("utf-8"))
+    for cmd in lang["compile_cmds"]:
+        digest.update(b"\0")
+        digest.update(toolchain_version(cmd[0]))
+    return digest.hexdigest()
+
+
+def restore_build(cached_binary, binary_path):
+    # Hardlink the cached binary; copy only when the cache is on another filesystem
+    try:
+        # A stale binary left in the workspace would make os.link fail with EEXIST
+        binary_path.unlink(missing_ok=True)
+        try:
+            os.link(cached_binary, binary_path)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.copy2(cached_binary, binary_path)
+        return True
+    except OSError:
+        return False
+
+
+def store_build(binary_path, cached_binary):
+    tmp_path = None
+    try:
+        cached_binary.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file, so concurrent runs never write into the same inode and an
+        # interrupted store cannot leave behind a read-only name that blocks later ones
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{cached_binary.name}.", suffix=".tmp", dir=cached_binary.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copy2(binary_path, tmp_path)
+        # Read-only, so writes through a hardlinked workspace copy cannot corrupt the cache
+        os.chmod(tmp_path, 0o555)
+        tmp_path.replace(cached_binary)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
 def run_execution(lang, workspace):
-    run_command("run", lang["run_cmd"], workspace, show_output=True)
+    cmd = lang["run_cmd"]
+    if cmd[0].startswith("./"):
+        # Built binaries run by absolute path with no cwd, which lets
+        # subprocess use posix_spawn instead of fork+exec
+        run_command("run", [workspace / cmd[0], *cmd[1:]], None, show_output=True)
+    else:
+        run_command("run", cmd, workspace, show_output=True)
+
+
+def fast_workspace_root():
+    # Prefer an executable tmpfs so build artifacts never touch the disk
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if not candidate:
+            continue
+        try:
+            flags = os.statvfs(candidate).f_flag
+        except OSError:
+            continue
+        if flags & (getattr(os, "ST_NOEXEC", 0) | os.ST_RDONLY):
+            continue
+        if os.access(candidate, os.W_OK | os.X_OK):
+            return Path(candidate)
+    return Path(tempfile.gettempdir())
+
+
+# Resolved once at import so later chdir calls cannot move the workspace
+WORKSPACE_ROOT = fast_workspace_root()
 
 
 def cleanup_workspace(path, silent=False):
@@ -175,34 +299,44 @@ def print_header(workspace):
     print(f"Workspace: {workspace}")
 
 
-def process_language(lang, workspace):
+def process_language(lang, workspace, missing_tools=()):
     banner = f" {lang['name']} "
     print(f"\n{banner:-^60}")
+    if missing_tools:
+        print(f"  [skip] toolchain not found: {', '.join(missing_tools)}")
+        return
     if not write_source_file(lang, workspace):
         return
     compile_cmds = lang.get("compile_cmds") or []
     if compile_cmds:
-        if not run_compile_steps(lang, workspace):
+        binary_name = Path(lang["run_cmd"][0]).name
+        cached_binary = BUILD_CACHE / build_key(lang) / binary_name
+        if restore_build(cached_binary, workspace / binary_name):
+            print(f"  [compile] cached build reused ({binary_name})")
+        elif not run_compile_steps(lang, workspace):
             print("  [run] skipped due to compilation failure")
             return
+        else:
+            store_build(workspace / binary_name, cached_binary)
     else:
         print("  [compile] not required")
     run_execution(lang, workspace)
 
 
 def main():
-    workspace = Path.cwd() / "multi_lang_hello_workspace"
+    workspace = WORKSPACE_ROOT / f"multi_lang_hello_workspace_{os.getpid()}"
+    atexit.register(shutil.rmtree, workspace, ignore_errors=True)
     cleanup_workspace(workspace, silent=True)
     workspace.mkdir(parents=True, exist_ok=True)
 
     print_header(workspace)
 
-    total_start = time.time()
+    total_start = time.perf_counter_ns()
     try:
         for lang in LANGUAGES:
-            process_language(lang, workspace)
+            process_language(lang, workspace, resolve_toolchain(lang))
     finally:
-        total_elapsed = time.time() - total_start
+        total_elapsed = (time.perf_counter_ns() - total_start) / 1e9
         print(f"\nTotal elapsed time: {total_elapsed:.4f}s")
         cleaned = cleanup_workspace(workspace)
         status = "ok" if cleaned else "failed"
@@ -6,26 +6,49 @@ Web-based Multi-Language Hello World
 Flask + HTML/CSS/JavaScript 기반
 
 실행: python3 web_hello.py
+초기화 후 실행: python3 web_hello.py --clean
 브라우저에서: http://localhost:5050
 """
 
+import argparse
+import errno
+import functools
+import gzip
+import hashlib
+import re
+import shlex
+import select
+import signal
 import subprocess
 import shutil
+import tempfile
 import time
 import json
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import List
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import socketserver
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import webbrowser
 import os
 
+try:
+    import orjson  # 선택 의존성: 있으면 C 구현으로 결과 직렬화
+
+    def json_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def json_bytes(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 # ==================== 설정 ====================
 
 PORT = 5050
 WORKSPACE = Path(__file__).parent / "web_hello_workspace"
+STATIC_DIR = Path(__file__).parent / "static"
+BUILD_CACHE = Path.home() / ".cache" / "hello_asm"
 
 # ==================== 데이터 클래스 ====================
 
@@ -38,6 +61,11 @@ class LanguageSpec:
     compile_cmds: List[List[str]]
     run_cmd: List[str]
     syntax: str
+    code_bytes: bytes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # 소스는 상수이므로 UTF-8 인코딩은 한 번만
+        self.code_bytes = self.code.encode("utf-8")
 
 # ==================== 언어 정의 ====================
 
@@ -136,6 +164,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=1920, height=1080">
     <title>🎓 Educational Multi-Language Hello World</title>
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/vs2015.min.css">
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/x86asm.min.js"></script>
@@ -398,8 +427,8 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         // 언어 데이터
         const languages = LANGUAGES_JSON;
 
-        // 상태 관리
-        let states = languages.map(() => ({
+        // 상태 관리 (언어별 상태는 고정 템플릿을 복사해 생성)
+        const STATE_TEMPLATE = Object.freeze({
             status: '대기 중',
             progress: 0,
             output: '',
@@ -409,7 +438,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             runTime: 0,
             totalTime: 0,
             failed: false
-        }));
+        });
+
+        let states = languages.map(() => ({ ...STATE_TEMPLATE }));
+
+        // 패널별 DOM 요소 (createPanels에서 한 번만 조회)
+        let panelRefs = [];
 
         let isRunning = false;
 
@@ -443,6 +477,14 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                 grid.appendChild(panel);
             });
 
+            panelRefs = languages.map((lang, idx) => ({
+                status: document.getElementById(`status-${idx}`),
+                progress: document.getElementById(`progress-${idx}`),
+                output: document.getElementById(`output-${idx}`),
+                timing: document.getElementById(`timing-${idx}`),
+                panel: document.getElementById(`panel-${idx}`)
+            }));
+
             // 신택스 하이라이팅 적용
             hljs.highlightAll();
         }
@@ -456,11 +498,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         }
 
         function updatePanel(idx, state) {
-            const statusEl = document.getElementById(`status-${idx}`);
-            const progressEl = document.getElementById(`progress-${idx}`);
-            const outputEl = document.getElementById(`output-${idx}`);
-            const timingEl = document.getElementById(`timing-${idx}`);
-            const panelEl = document.getElementById(`panel-${idx}`);
+            const refs = panelRefs[idx];
+            const statusEl = refs.status;
+            const progressEl = refs.progress;
+            const outputEl = refs.output;
+            const timingEl = refs.timing;
+            const panelEl = refs.panel;
 
             // 상태 업데이트
             let statusIcon = '⏳';
@@ -500,23 +543,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             document.getElementById('globalStatus').textContent = '🚀 실행 중...';
 
             // 상태 초기화
-            states = languages.map(() => ({
-                status: '준비 중',
-                progress: 0,
-                output: '',
-                error: '',
-                writeTime: 0,
-                compileTime: 0,
-                runTime: 0,
-                totalTime: 0,
-                failed: false
-            }));
+            states = languages.map(() => ({ ...STATE_TEMPLATE, status: '준비 중' }));
 
             const startTime = performance.now();
 
-            // 모든 언어 병렬 실행
-            const promises = languages.map((lang, idx) => executeLanguage(idx));
-            await Promise.all(promises);
+            // 모든 언어를 서버에서 병렬 실행 (스트림 하나, 끝나는 대로 패널 갱신)
+            await streamResults();
 
             const totalTime = (performance.now() - startTime) / 1000;
 
@@ -532,50 +564,61 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             isRunning = false;
         }
 
-        async function executeLanguage(idx) {
+        function applyResult(idx, result) {
             const state = states[idx];
 
-            try {
-                // API 호출
-                const response = await fetch(`/execute/${idx}`);
-                const result = await response.json();
-
-                // 결과 적용
-                state.status = result.status;
-                state.progress = result.progress;
-                state.output = result.output;
-                state.error = result.error;
-                state.writeTime = result.write_time;
-                state.compileTime = result.compile_time;
-                state.runTime = result.run_time;
-                state.totalTime = result.total_time;
-                state.failed = result.failed;
-
-                updatePanel(idx, state);
-
-            } catch (err) {
-                state.status = '통신 오류';
-                state.error = err.message;
-                state.failed = true;
-                state.progress = 100;
-                updatePanel(idx, state);
-            }
+            // 서버는 빈 문자열/0/false 필드를 생략하므로 기본값으로 채움
+            state.status = result.status || '';
+            state.progress = result.progress || 0;
+            state.output = result.output || '';
+            state.error = result.error || '';
+            state.writeTime = result.write_time || 0;
+            state.compileTime = result.compile_time || 0;
+            state.runTime = result.run_time || 0;
+            state.totalTime = result.total_time || 0;
+            state.failed = result.failed || false;
+
+            updatePanel(idx, state);
+        }
+
+        function streamResults() {
+            return new Promise(resolve => {
+                // Server-Sent Events: 언어별로 단계가 바뀔 때마다 중간 결과, 끝나면 done 결과가 도착
+                const source = new EventSource('/run');
+                const done = new Set();
+
+                source.onmessage = event => {
+                    const result = JSON.parse(event.data);
+                    applyResult(result.idx, result);
+                    if (!result.done) return;
+                    done.add(result.idx);
+
+                    if (done.size === languages.length) {
+                        source.close();
+                        resolve();
+                    }
+                };
+
+                source.onerror = () => {
+                    // 자동 재연결을 막고, 결과를 받지 못한 언어만 오류로 표시
+                    source.close();
+                    states.forEach((state, idx) => {
+                        if (done.has(idx)) return;
+                        state.status = '통신 오류';
+                        state.error = '결과 스트림이 끊어졌습니다';
+                        state.failed = true;
+                        state.progress = 100;
+                        updatePanel(idx, state);
+                    });
+                    resolve();
+                };
+            });
         }
 
         function resetAll() {
             if (isRunning) return;
 
-            states = languages.map(() => ({
-                status: '대기 중',
-                progress: 0,
-                output: '',
-                error: '',
-                writeTime: 0,
-                compileTime: 0,
-                runTime: 0,
-                totalTime: 0,
-                failed: false
-            }));
+            states = languages.map(() => ({ ...STATE_TEMPLATE }));
 
             states.forEach((state, idx) => updatePanel(idx, state));
             document.getElementById('globalStatus').textContent = "준비됨 - '실행' 버튼을 클릭하세요";
@@ -588,51 +631,167 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </html>
 '''
 
+# highlight.js 자산: static/에 같은 이름의 파일이 있으면 로컬에서, 없으면 CDN에서 로드
+HLJS_ASSETS = {
+    "vs2015.min.css": "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/vs2015.min.css",
+    "highlight.min.js": "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js",
+    "x86asm.min.js": "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/x86asm.min.js",
+}
+
+STATIC_CONTENT_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+
+def load_static_assets():
+    """static/의 highlight.js 자산을 한 번만 읽어 (원본, gzip, Content-Type)으로 보관"""
+    assets = {}
+    for name in HLJS_ASSETS:
+        try:
+            data = (STATIC_DIR / name).read_bytes()
+        except OSError:
+            continue
+        content_type = STATIC_CONTENT_TYPES[Path(name).suffix]
+        assets[f"/static/{name}"] = (data, gzip.compress(data, compresslevel=9), content_type)
+    return assets
+
+STATIC_ASSETS = load_static_assets()
+
+def render_template():
+    """언어 데이터를 채우고, 로컬에 있는 자산은 CDN 주소 대신 /static/ 경로로 교체"""
+    html = HTML_TEMPLATE.replace('LANGUAGES_JSON', LANGUAGES_JSON)
+    for name, cdn_url in HLJS_ASSETS.items():
+        if f"/static/{name}" in STATIC_ASSETS:
+            html = html.replace(cdn_url, f"/static/{name}")
+    return html
+
+# 언어 데이터와 페이지는 고정이므로 시작 시 한 번만 렌더링해 바이트로 보관
+# (요청마다 치환/인코딩 없이 버퍼 하나를 write 한 번으로 전송하므로, 템플릿을 파일로
+#  분리하거나 앞뒤 조각으로 나눠 보낼 필요가 없음)
+LANGUAGES_JSON = json.dumps([
+    {
+        "name": l.name,
+        "filename": l.filename,
+        "color": l.color,
+        "code": l.code,
+        "syntax": l.syntax,
+    }
+    for l in LANGUAGES
+], ensure_ascii=False)
+
+INDEX_HTML = render_template().encode('utf-8')
+INDEX_HTML_LENGTH = str(len(INDEX_HTML))
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, compresslevel=9)
+INDEX_HTML_GZIP_LENGTH = str(len(INDEX_HTML_GZIP))
+
 # ==================== HTTP 핸들러 ====================
 
+INDEX_PATHS = frozenset(('/', '/index.html'))
+EXECUTE_PATH = re.compile(r'/execute/(\d+)')
+
 class HelloHandler(SimpleHTTPRequestHandler):
+    # 헤더와 본문이 별도 send()로 나가므로, Nagle 알고리즘이 본문을 ACK까지 붙잡지 않도록
+    # setup()에서 TCP_NODELAY 설정
+    disable_nagle_algorithm = True
+
     def do_GET(self):
-        if self.path == '/' or self.path == '/index.html':
+        if self.path in INDEX_PATHS:
             self._serve_html()
-        elif self.path.startswith('/execute/'):
-            self._handle_execute()
+        elif self.path in STATIC_ASSETS:
+            self._serve_static()
+        elif self.path == '/run':
+            self._stream_results()
+        elif match := EXECUTE_PATH.fullmatch(self.path):
+            self._handle_execute(int(match.group(1)))
         else:
             self.send_error(404)
 
+    def _accepts_gzip(self):
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
     def _serve_html(self):
-        # 언어 데이터를 JSON으로 변환
-        lang_json = json.dumps([
-            {
-                "name": l.name,
-                "filename": l.filename,
-                "color": l.color,
-                "code": l.code,
-                "syntax": l.syntax,
-            }
-            for l in LANGUAGES
-        ], ensure_ascii=False)
+        # 미리 렌더링(및 압축)된 페이지를 그대로 전송
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Vary', 'Accept-Encoding')
+        if self._accepts_gzip():
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', INDEX_HTML_GZIP_LENGTH)
+            self.end_headers()
+            self.wfile.write(INDEX_HTML_GZIP)
+        else:
+            self.send_header('Content-Length', INDEX_HTML_LENGTH)
+            self.end_headers()
+            self.wfile.write(INDEX_HTML)
 
-        html = HTML_TEMPLATE.replace('LANGUAGES_JSON', lang_json)
+    def _serve_static(self):
+        data, data_gzip, content_type = STATIC_ASSETS[self.path]
 
         self.send_response(200)
-        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Type', content_type)
+        # 버전이 고정된 라이브러리 파일이므로 브라우저가 다시 요청하지 않도록 장기 캐시
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.send_header('Vary', 'Accept-Encoding')
+        if self._accepts_gzip():
+            data = data_gzip
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
         self.end_headers()
-        self.wfile.write(html.encode('utf-8'))
+        self.wfile.write(data)
+
+    def _send_json(self, payload, status=200):
+        body = json_bytes(payload)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Vary', 'Accept-Encoding')
+        if self._accepts_gzip():
+            # 결과 JSON은 작으므로 가장 빠른 압축 수준으로 충분
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
-    def _handle_execute(self):
-        try:
-            idx = int(self.path.split('/')[-1])
-            result = execute_language(idx)
+    def _handle_execute(self, idx):
+        if idx >= len(LANGUAGES):
+            self._send_json({"error": f"알 수 없는 언어 번호: {idx}"}, status=404)
+            return
 
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        try:
+            self._send_json(compact_result(execute_language(idx)))
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+            self._send_json({"error": str(e)}, status=500)
+
+    def _stream_results(self):
+        # 모든 언어를 풀에 넣고, 단계가 바뀌거나 끝날 때마다 SSE 이벤트 하나씩 전송
+        events = queue.Queue()
+
+        def run(idx):
+            try:
+                result = execute_language(idx, on_progress=lambda i, partial: events.put((i, partial, False)))
+            except Exception as e:
+                result = {"status": "서버 오류", "progress": 100, "error": str(e), "failed": True}
+            events.put((idx, result, True))
+
+        for idx in range(len(LANGUAGES)):
+            EXECUTOR.submit(run, idx)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        remaining = len(LANGUAGES)
+        while remaining:
+            idx, result, done = events.get()
+            payload = compact_result(result)
+            payload["idx"] = idx
+            if done:
+                payload["done"] = True
+                remaining -= 1
+            self.wfile.write(b"data: " + json_bytes(payload) + b"\n\n")
+            self.wfile.flush()
 
     def log_message(self, format, *args):
         # 로그 출력 억제 (깔끔한 출력을 위해)
@@ -640,24 +799,53 @@ class HelloHandler(SimpleHTTPRequestHandler):
 
 # ==================== 실행 로직 ====================
 
+# 작업은 대부분 컴파일러/바이너리 대기이므로 CPU 수와 관계없이 언어마다 한 스레드
+EXECUTOR = ThreadPoolExecutor(max_workers=len(LANGUAGES))
+
+# 설치되지 않은 컴파일러는 시작 시 한 번만 확인 (요청마다 실패할 프로세스를 띄우지 않음)
+MISSING_TOOLS = {
+    spec.name: [cmd[0] for cmd in spec.compile_cmds if shutil.which(cmd[0]) is None]
+    for spec in LANGUAGES
+}
+
+# 패널에 보여줄 출력은 앞부분만 디코딩
+OUTPUT_DECODE_LIMIT = 4096
+
+# 자식 프로세스 환경: 사용자 환경은 그대로 두고(rustup/ccache 등이 의존) 로캘만 C로 고정해
+# 컴파일러 시작 시 로캘 데이터 로딩을 생략
+SUBPROCESS_ENV = {**os.environ, "LC_ALL": "C"}
+
+def decode_output(data):
+    """바이트 출력의 앞부분만 UTF-8로 디코딩 (비어 있으면 디코딩 생략)"""
+    if not data:
+        return ""
+    return data[:OUTPUT_DECODE_LIMIT].decode("utf-8", "replace").strip()
+
 def run_subprocess(cmd, cwd):
     """서브프로세스 실행"""
+    # 요청 스레드나 EXECUTOR 워커에서만 호출되므로, 여기서 블로킹해도 GIL이 풀려
+    # 다른 언어의 fork/exec/대기와 겹쳐 진행됨 (이벤트 루프를 막을 일이 없음)
     start = time.time()
     try:
+        # CPython은 리눅스에서 vfork로 자식을 만들어 서버 힙을 복사하지 않으므로 별도 헬퍼
+        # 프로세스가 필요 없음. close_fds=False: 파이썬이 연 fd(리슨 소켓 포함)는 기본적으로
+        # 상속되지 않으므로 자식에서 fd를 닫는 단계를 생략
         result = subprocess.run(
             cmd,
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             check=True,
             timeout=30,
+            close_fds=False,
+            env=SUBPROCESS_ENV,
         )
         elapsed = time.time() - start
-        return True, elapsed, result.stdout.strip(), result.stderr.strip()
+        # 출력은 bytes로 받고, 성공 시에는 stderr를 쓰지 않으므로 디코딩하지 않음
+        return True, elapsed, decode_output(result.stdout), ""
     except subprocess.CalledProcessError as e:
         elapsed = time.time() - start
-        return False, elapsed, e.stdout or "", e.stderr or str(e)
+        return False, elapsed, decode_output(e.stdout), decode_output(e.stderr) or str(e)
     except FileNotFoundError as e:
         elapsed = time.time() - start
         return False, elapsed, "", f"명령어를 찾을 수 없음: {cmd[0]}"
@@ -665,8 +853,130 @@ def run_subprocess(cmd, cwd):
         elapsed = time.time() - start
         return False, elapsed, "", "타임아웃 (30초 초과)"
 
-def execute_language(idx):
-    """단일 언어 실행"""
+def fast_run(argv):
+    """빌드된 바이너리를 os.posix_spawn으로 직접 실행 (stdout/stderr는 파이프 하나로 수집)"""
+    start = time.time()
+    read_fd, write_fd = os.pipe()
+    try:
+        # Popen의 실행 상태 파이프, fd 정리 등을 거치지 않고 파이프만 1/2번에 연결.
+        # 파이썬이 무시(SIG_IGN)하도록 바꿔 둔 SIGPIPE/SIGXFSZ는 subprocess처럼 기본값으로 복원
+        pid = os.posix_spawn(argv[0], argv, SUBPROCESS_ENV, file_actions=[
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_DUP2, write_fd, 2),
+        ], setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+    except OSError as e:
+        os.close(read_fd)
+        os.close(write_fd)
+        return False, time.time() - start, "", str(e)
+    os.close(write_fd)
+
+    chunks = []
+    timed_out = False
+    deadline = start + 30
+    try:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                break
+            chunk = os.read(read_fd, OUTPUT_DECODE_LIMIT)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+        _, status = os.waitpid(pid, 0)
+    elapsed = time.time() - start
+
+    if timed_out:
+        return False, elapsed, "", "타임아웃 (30초 초과)"
+    output = b"".join(chunks)
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code == 0:
+        return True, elapsed, decode_output(output), ""
+    return False, elapsed, "", decode_output(output) or f"종료 코드 {exit_code}"
+
+def build_command(spec):
+    """컴파일 명령어 (nasm + ld처럼 여러 단계면 셸 하나로 묶어 프로세스 생성을 한 번으로)"""
+    if len(spec.compile_cmds) == 1:
+        return spec.compile_cmds[0]
+    script = " && ".join(shlex.join(cmd) for cmd in spec.compile_cmds)
+    return [shutil.which("sh") or "/bin/sh", "-c", script]
+
+@functools.lru_cache(maxsize=None)
+def toolchain_version(tool):
+    """툴체인 버전 출력 (프로세스당 한 번만 조회, 없으면 빈 값)"""
+    try:
+        result = subprocess.run(
+            [tool, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+        return result.stdout
+    except (OSError, subprocess.SubprocessError):
+        return b""
+
+def build_key(spec):
+    """소스 코드, 컴파일 명령어, 툴체인 버전으로 캐시 키 생성"""
+    digest = hashlib.sha256()
+    digest.update(spec.code_bytes)
+    digest.update(b"\0")
+    digest.update(repr(spec.compile_cmds).encode("utf-8"))
+    for cmd in spec.compile_cmds:
+        digest.update(b"\0")
+        digest.update(toolchain_version(cmd[0]))
+    return digest.hexdigest()
+
+def restore_build(cached_binary, binary_path):
+    """캐시된 바이너리를 워크스페이스에 하드 링크 (다른 파일시스템이면 복사, 캐시에 없으면 False)"""
+    if not cached_binary.exists():
+        return False
+    try:
+        # 이전 요청이 남긴 바이너리도 같은 소스에서 나온 것이지만, 링크를 위해 먼저 치움
+        binary_path.unlink(missing_ok=True)
+        try:
+            os.link(cached_binary, binary_path)
+        except FileExistsError:
+            pass  # 같은 언어의 동시 요청이 먼저 연결함
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copy2(cached_binary, binary_path)
+        return True
+    except OSError:
+        return False
+
+def store_build(binary_path, cached_binary):
+    """컴파일된 바이너리를 캐시에 저장 (실패해도 무시)"""
+    tmp_path = None
+    try:
+        cached_binary.parent.mkdir(parents=True, exist_ok=True)
+        # 동시에 저장하는 다른 프로세스/스레드와 겹치지 않고, 중단돼도 이후 저장을 막지 않는 고유한 임시 파일
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{cached_binary.name}.", suffix=".tmp", dir=cached_binary.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copy2(binary_path, tmp_path)
+        # 읽기 전용으로 두어 하드 링크된 워크스페이스 쪽 쓰기가 캐시를 덮어쓰지 못하게 함
+        os.chmod(tmp_path, 0o555)
+        tmp_path.replace(cached_binary)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+def write_source_if_changed(path, data):
+    """내용이 다를 때만 기록 (같으면 쓰기 생략, 기록했으면 True)"""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+def execute_language(idx, on_progress=None):
+    """단일 언어 실행 (on_progress가 있으면 단계가 바뀔 때마다 중간 결과 사본을 전달)"""
     spec = LANGUAGES[idx]
     result = {
         "status": "대기 중",
@@ -680,6 +990,15 @@ def execute_language(idx):
         "failed": False,
     }
 
+    # 툴체인이 없으면 파일 작성/프로세스 생성 없이 바로 실패 처리
+    missing = MISSING_TOOLS[spec.name]
+    if missing:
+        result["status"] = "컴파일 실패"
+        result["error"] = f"툴체인을 찾을 수 없음: {', '.join(missing)}"
+        result["failed"] = True
+        result["progress"] = 100
+        return result
+
     # 워크스페이스 준비
     if not WORKSPACE.exists():
         WORKSPACE.mkdir(parents=True, exist_ok=True)
@@ -688,7 +1007,8 @@ def execute_language(idx):
     start = time.time()
     source_path = WORKSPACE / spec.filename
     try:
-        source_path.write_text(spec.code, encoding="utf-8")
+        # 이전 요청이 같은 소스를 이미 써 두었으면 mtime을 건드리지 않고 넘어감
+        write_source_if_changed(source_path, spec.code_bytes)
         result["write_time"] = time.time() - start
         result["progress"] = 25
     except OSError as e:
@@ -698,30 +1018,42 @@ def execute_language(idx):
         result["progress"] = 100
         return result
 
-    # 2. 컴파일
-    if spec.compile_cmds:
+    # 2. 컴파일 (같은 빌드가 캐시에 있으면 생략)
+    binary_name = Path(spec.run_cmd[0]).name
+    binary_path = WORKSPACE / binary_name
+    cached_binary = BUILD_CACHE / build_key(spec) / binary_name
+
+    if spec.compile_cmds and restore_build(cached_binary, binary_path):
+        result["status"] = "컴파일 완료 (캐시)"
+        result["progress"] = 70
+        if on_progress is not None:
+            on_progress(idx, dict(result))
+    elif spec.compile_cmds:
         result["status"] = "컴파일 중..."
-        compile_total = 0.0
-
-        for cmd in spec.compile_cmds:
-            success, elapsed, stdout, stderr = run_subprocess(cmd, WORKSPACE)
-            compile_total += elapsed
-
-            if not success:
-                result["status"] = "컴파일 실패"
-                result["error"] = stderr or stdout
-                result["failed"] = True
-                result["compile_time"] = compile_total
-                result["total_time"] = result["write_time"] + result["compile_time"]
-                result["progress"] = 100
-                return result
-
-        result["compile_time"] = compile_total
+        if on_progress is not None:
+            on_progress(idx, dict(result))
+        success, elapsed, stdout, stderr = run_subprocess(build_command(spec), WORKSPACE)
+        result["compile_time"] = elapsed
+
+        if not success:
+            result["status"] = "컴파일 실패"
+            result["error"] = stderr or stdout
+            result["failed"] = True
+            result["total_time"] = result["write_time"] + result["compile_time"]
+            result["progress"] = 100
+            return result
+
         result["progress"] = 70
+        store_build(binary_path, cached_binary)
 
-    # 3. 실행
+    # 3. 실행 (빌드된 바이너리는 절대 경로로 바로 spawn, 그 외에는 일반 경로)
     result["status"] = "실행 중..."
-    success, elapsed, stdout, stderr = run_subprocess(spec.run_cmd, WORKSPACE)
+    if on_progress is not None:
+        on_progress(idx, dict(result))
+    if hasattr(os, "posix_spawn") and binary_path.is_file():
+        success, elapsed, stdout, stderr = fast_run([str(binary_path), *spec.run_cmd[1:]])
+    else:
+        success, elapsed, stdout, stderr = run_subprocess(spec.run_cmd, WORKSPACE)
     result["run_time"] = elapsed
     result["total_time"] = result["write_time"] + result["compile_time"] + result["run_time"]
 
@@ -737,12 +1069,33 @@ def execute_language(idx):
 
     return result
 
+def compact_result(result):
+    """빈 문자열, 0, False 필드를 뺀 응답용 결과 (브라우저가 기본값으로 채움)"""
+    return {key: value for key, value in result.items() if value not in ("", 0, False)}
+
+# ==================== 서버 ====================
+
+class HelloServer(ThreadingHTTPServer):
+    """요청마다 스레드를 띄워 /execute/N 호출이 서로 기다리지 않도록 함"""
+    daemon_threads = True
+
 # ==================== 메인 ====================
 
+def clean_state():
+    """워크스페이스와 이 스크립트 언어들의 빌드 캐시 삭제"""
+    shutil.rmtree(WORKSPACE, ignore_errors=True)
+    for spec in LANGUAGES:
+        shutil.rmtree(BUILD_CACHE / build_key(spec), ignore_errors=True)
+
 def main():
-    # 워크스페이스 초기화
-    if WORKSPACE.exists():
-        shutil.rmtree(WORKSPACE)
+    parser = argparse.ArgumentParser(description="Web-based Multi-Language Hello World")
+    parser.add_argument("--clean", action="store_true",
+                        help="워크스페이스와 빌드 캐시를 지우고 처음부터 시작")
+    args = parser.parse_args()
+
+    # 워크스페이스는 실행 사이에 유지 (소스/바이너리가 그대로면 다음 실행에서 재사용)
+    if args.clean:
+        clean_state()
     WORKSPACE.mkdir(parents=True, exist_ok=True)
 
     print(f"""
@@ -759,6 +1112,10 @@ def main():
 ╚══════════════════════════════════════════════════════════════╝
 """)
 
+    for name, tools in MISSING_TOOLS.items():
+        if tools:
+            print(f"⚠️  {name}: 툴체인을 찾을 수 없음 ({', '.join(tools)}) - 해당 언어는 실패로 표시됩니다")
+
     # 브라우저 자동 열기 (백그라운드)
     def open_browser():
         time.sleep(1)
@@ -767,16 +1124,11 @@ def main():
     threading.Thread(target=open_browser, daemon=True).start()
 
     # 서버 시작
-    with socketserver.TCPServer(("", PORT), HelloHandler) as httpd:
+    with HelloServer(("", PORT), HelloHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n서버를 종료합니다...")
-        finally:
-            # 정리
-            if WORKSPACE.exists():
-                shutil.rmtree(WORKSPACE)
-            print("✅ 정리 완료")
 
 if __name__ == "__main__":
     main()